@@ -17,7 +17,7 @@ Contract:
 - --max-bytes-per-file <N>: Maximum bytes per file (default: 1000000)
 - --include-ext <exts>: Comma-separated extensions to include (e.g., .env,.txt)
 - --follow-symlinks: Follow symlinks during directory traversal (default: OFF)
-- Output: JSON to stdout, stable formatting
+- Output: JSON to stdout, stable formatting (sorted keys, compact separators)
 
 Exit codes:
 - 0: No findings at/above threshold (or --exit-zero)
@@ -28,54 +28,158 @@ Exit codes:
 
 import argparse
 import json
+import os
+import stat
 import sys
-from datetime import datetime, timezone
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import (
+    TYPE_CHECKING, Any, Callable, Deque, Dict, FrozenSet, Iterator, List, NamedTuple,
+    Optional, Tuple,
+)
 
 from compliancepack import __version__
-from compliancepack.engine import run_check, run_check_multi
-from compliancepack.packs import PackError, list_packs, load_pack
 from compliancepack.policy import SEVERITY_LEVELS, PolicyValidationError, load_policy_file
-from compliancepack.scanner import (
-    ScanError,
-    collect_targets,
-    read_file_limited,
-    summarize_skipped,
-)
-from compliancepack.sariflite import render_sariflite
 from compliancepack.threshold import (
     EXIT_OK,
     EXIT_RUNTIME,
     EXIT_USAGE,
     EXIT_VIOLATION,
-    count_violations,
+    count_and_truncate,
     determine_exit_code,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
 # Valid output formats
 OUTPUT_FORMATS = ("compliancepack.check.v1", "compliancepack.sariflite.v1")
 
+# Choice lists for help and error text (joined once at import)
+SEVERITY_CHOICES_TEXT = ", ".join(SEVERITY_LEVELS)
+OUTPUT_FORMATS_TEXT = ", ".join(OUTPUT_FORMATS)
+
 # Default limits
 DEFAULT_MAX_FILES = 5000
 DEFAULT_MAX_BYTES_PER_FILE = 1_000_000
 
+# Upper bound on concurrent file reads in directory scans
+MAX_READ_WORKERS = 32
+
 
 def _get_timestamp(fixed_time: Optional[str] = None) -> str:
     """Get timestamp for output, using fixed time if provided."""
     if fixed_time:
         return fixed_time
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Format UTC fields directly (no tz-aware datetime, no strftime parsing)
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
 
 
 def _output_json(data: Dict[str, Any]) -> None:
-    """Output JSON with stable formatting (deterministic)."""
-    json_str = json.dumps(data, sort_keys=True, separators=(",", ": "), ensure_ascii=False)
-    print(json_str)
+    """
+    Output JSON with stable formatting (deterministic).
+
+    Uses orjson when it is importable (optional accelerator, not a
+    dependency) and falls back to the stdlib encoder otherwise. Both paths
+    emit identical bytes: sorted keys, compact separators, UTF-8, trailing
+    newline. The document goes to the binary stdout in a single write,
+    bypassing the text layer's encoding step.
+    """
+    payload = _json_encoder()(data) + b"\n"
+
+    out = sys.stdout.buffer
+    out.write(payload)
+    out.flush()
+
+
+def _json_encoder() -> Callable[[Any], bytes]:
+    """
+    Return a callable encoding one value as deterministic JSON bytes.
+
+    Same encoding as _output_json (sorted keys, compact separators, UTF-8),
+    without the trailing newline, so fragments can be concatenated.
+
+    Paths that are not valid UTF-8 reach the report as surrogate escapes
+    (os.scandir decodes them that way). The stdlib encoder writes them back
+    as their original bytes, like print() to stdout does, and orjson, which
+    rejects surrogates, hands such values to it.
+    """
+    encoder = json.JSONEncoder(
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+    def encode_stdlib(value: Any) -> bytes:
+        return encoder.encode(value).encode("utf-8", "surrogateescape")
 
+    try:
+        import orjson
+    except ImportError:
+        return encode_stdlib
 
-def _parse_extensions(ext_str: Optional[str]) -> Optional[Set[str]]:
-    """Parse comma-separated extension string into set."""
+    def encode(value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            return encode_stdlib(value)
+
+    return encode
+
+
+def _output_check_report(
+    envelope: Dict[str, Any],
+    findings: List[Dict[str, Any]],
+    findings_limit: int,
+) -> None:
+    """
+    Output a check.v1 report, encoding findings one at a time.
+
+    Equivalent to _output_json({**envelope, "findings": findings[:findings_limit]})
+    but never builds the merged dict or one JSON string: keys are taken in
+    sorted order and each finding is encoded as its own fragment. Every
+    fragment is encoded before the first write, so a value that fails to
+    encode leaves stdout empty rather than holding a truncated document.
+
+    Args:
+        envelope: Report fields other than "findings"
+        findings: Sorted findings list (not copied or mutated)
+        findings_limit: Number of leading findings to emit
+    """
+    encode = _json_encoder()
+    parts: List[bytes] = [b"{"]
+
+    for key_index, key in enumerate(sorted([*envelope, "findings"])):
+        if key_index:
+            parts.append(b",")
+        parts.append(encode(key))
+        parts.append(b":")
+        if key != "findings":
+            parts.append(encode(envelope[key]))
+            continue
+        parts.append(b"[")
+        for index in range(findings_limit):
+            if index:
+                parts.append(b",")
+            parts.append(encode(findings[index]))
+        parts.append(b"]")
+    parts.append(b"}\n")
+
+    out = sys.stdout.buffer
+    out.writelines(parts)
+    out.flush()
+
+
+def _parse_extensions(ext_str: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    Parse comma-separated extension string into a frozenset.
+
+    Extensions are lowercased and dot-prefixed. Returns None (not an empty
+    set) when no filter applies, so the scanner can skip the suffix test.
+    """
     if not ext_str:
         return None
     extensions = set()
@@ -86,11 +190,13 @@ def _parse_extensions(ext_str: Optional[str]) -> Optional[Set[str]]:
             if not ext.startswith("."):
                 ext = "." + ext
             extensions.add(ext.lower())
-    return extensions if extensions else None
+    return frozenset(extensions) if extensions else None
 
 
 def cmd_list_packs() -> int:
     """List available packs and exit."""
+    from compliancepack.packs import list_packs
+
     packs = list_packs()
 
     if not packs:
@@ -103,22 +209,144 @@ def cmd_list_packs() -> int:
     return EXIT_OK
 
 
-def _is_single_file_input(inputs: List[str]) -> bool:
+class _StreamedContents:
+    """
+    Contents of the files to scan, read ahead concurrently, as an ordered
+    stream of (path string, content) pairs.
+
+    Files are streamed in path string order, the order run_check_multi
+    scans them in. File reads are I/O-bound and release the GIL, so a
+    thread pool overlaps their latency. Only a bounded window of reads is
+    in flight or waiting, and each content is handed over once, so a scan
+    holds a few files in memory rather than all of them. The stream can be
+    iterated once.
+
+    Unreadable files are streamed with empty content and recorded, in
+    stream order, in failures as (path, "read_error").
+    """
+
+    def __init__(
+        self,
+        files: List[Path],
+        max_bytes: int,
+        executor: "Executor",
+        window: int,
+    ) -> None:
+        self._files = sorted(files, key=str)
+        self._max_bytes = max_bytes
+        self._executor = executor
+        self._window = max(1, window)
+        self.failures: List[Tuple[Path, str]] = []
+
+    def _read(self, path: Path) -> Optional[str]:
+        from compliancepack.scanner import ScanError, read_file_limited
+
+        try:
+            content, _ = read_file_limited(path, self._max_bytes)
+        except ScanError:
+            return None
+        return content
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        files = self._files
+        pending: Deque["Future[Optional[str]]"] = deque()
+        ahead = 0  # Index of the next file to submit
+        for path in files:
+            # Top up the read-ahead window, then hand over this file
+            while len(pending) < self._window and ahead < len(files):
+                pending.append(self._executor.submit(self._read, files[ahead]))
+                ahead += 1
+            content = pending.popleft().result()
+            if content is None:
+                self.failures.append((path, "read_error"))
+                content = ""
+            yield str(path), content
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+class InputStat(NamedTuple):
+    """File-type facts for one --input path."""
+    exists: bool
+    is_file: bool
+
+
+def _stat_once(path: str) -> InputStat:
+    """
+    Stat an input path with a single syscall in the common case.
+
+    Uses lstat; only a symlink costs a second stat to inspect its target.
+    Follows symlinks for exists/is_file, matching Path.exists()/is_file().
+    """
+    try:
+        st = os.lstat(path)
+    except (OSError, ValueError):
+        return InputStat(exists=False, is_file=False)
+
+    if not stat.S_ISLNK(st.st_mode):
+        return InputStat(exists=True, is_file=stat.S_ISREG(st.st_mode))
+
+    try:
+        target = os.stat(path)
+    except (OSError, ValueError):
+        # Broken symlink: reported as missing, like Path.exists()
+        return InputStat(exists=False, is_file=False)
+    return InputStat(exists=True, is_file=stat.S_ISREG(target.st_mode))
+
+
+class CheckArgs(NamedTuple):
+    """
+    Parsed `check` options, read once from the argparse namespace.
+
+    Field names match the argparse dests; defaults live only in the
+    parser (see _attach_check_subparser()).
+    """
+    input: Optional[List[str]]
+    policy: Optional[str]
+    pack: Optional[str]
+    list_packs: bool
+    fixed_time: Optional[str]
+    redact: bool
+    fail_on: str
+    format: str
+    max_findings: int
+    exit_zero: bool
+    max_files: int
+    max_bytes_per_file: int
+    include_ext: Optional[str]
+    follow_symlinks: bool
+
+    @classmethod
+    def from_namespace(cls, args: argparse.Namespace) -> "CheckArgs":
+        """Build from a namespace produced by the check subparser."""
+        values = vars(args)
+        return cls(*[values[field] for field in cls._fields])
+
+
+def _is_single_file_input(input_stats: List[InputStat]) -> bool:
     """Check if input is a single file (not directory)."""
-    if len(inputs) != 1:
-        return False
-    path = Path(inputs[0])
-    return path.exists() and path.is_file()
+    return len(input_stats) == 1 and input_stats[0].is_file
 
 
 def cmd_check(args: argparse.Namespace) -> int:
     """Execute the 'check' subcommand."""
+    # Deferred so --help, --version and --list-packs skip the engine
+    from concurrent.futures import ThreadPoolExecutor
+
+    from compliancepack.engine import run_check, run_check_multi
+    from compliancepack.packs import PackError, load_pack
+    from compliancepack.sariflite import render_sariflite
+    from compliancepack.scanner import ScanError, collect_targets, summarize_skipped
+
+    ca = CheckArgs.from_namespace(args)
+
     # Handle --list-packs first
-    if getattr(args, "list_packs", False):
+    if ca.list_packs:
         return cmd_list_packs()
 
     # Get inputs (can be multiple via repeated --input)
-    inputs = getattr(args, "input", None) or []
+    inputs = ca.input or []
     if isinstance(inputs, str):
         inputs = [inputs]
 
@@ -126,17 +354,20 @@ def cmd_check(args: argparse.Namespace) -> int:
         sys.stderr.write("Error: --input is required for check command\n")
         return EXIT_USAGE
 
-    # Validate at least one input exists
+    # Validate every input exists (one stat per input)
     existing_inputs = []
+    input_stats: List[InputStat] = []
     for inp in inputs:
-        if not Path(inp).exists():
+        input_stat = _stat_once(inp)
+        if not input_stat.exists:
             sys.stderr.write(f"Error: Input path not found: {inp}\n")
             return EXIT_RUNTIME
         existing_inputs.append(inp)
+        input_stats.append(input_stat)
 
     # Determine policy source: --policy or --pack (mutually exclusive)
-    policy = getattr(args, "policy", None)
-    pack = getattr(args, "pack", None)
+    policy = ca.policy
+    pack = ca.pack
 
     if policy and pack:
         sys.stderr.write("Error: Cannot specify both --policy and --pack\n")
@@ -147,56 +378,58 @@ def cmd_check(args: argparse.Namespace) -> int:
         return EXIT_USAGE
 
     # Validate --fail-on severity
-    fail_on = getattr(args, "fail_on", "high")
+    fail_on = ca.fail_on
     if fail_on not in SEVERITY_LEVELS:
         sys.stderr.write(
             f"Error: Invalid --fail-on value '{fail_on}'. "
-            f"Must be one of: {', '.join(SEVERITY_LEVELS)}\n"
+            f"Must be one of: {SEVERITY_CHOICES_TEXT}\n"
         )
         return EXIT_USAGE
 
     # Validate --format
-    output_format = getattr(args, "format", "compliancepack.check.v1")
+    output_format = ca.format
     if output_format not in OUTPUT_FORMATS:
         sys.stderr.write(
             f"Error: Invalid --format value '{output_format}'. "
-            f"Must be one of: {', '.join(OUTPUT_FORMATS)}\n"
+            f"Must be one of: {OUTPUT_FORMATS_TEXT}\n"
         )
         return EXIT_USAGE
 
     # Validate --max-findings
-    max_findings = getattr(args, "max_findings", 0) or 0
+    max_findings = ca.max_findings or 0
     if max_findings < 0:
         sys.stderr.write("Error: --max-findings must be a non-negative integer\n")
         return EXIT_USAGE
 
     # Validate --max-files
-    max_files = getattr(args, "max_files", DEFAULT_MAX_FILES)
+    max_files = ca.max_files
     if max_files < 1:
         sys.stderr.write("Error: --max-files must be >= 1\n")
         return EXIT_USAGE
 
     # Validate --max-bytes-per-file
-    max_bytes = getattr(args, "max_bytes_per_file", DEFAULT_MAX_BYTES_PER_FILE)
+    max_bytes = ca.max_bytes_per_file
     if max_bytes < 1:
         sys.stderr.write("Error: --max-bytes-per-file must be >= 1\n")
         return EXIT_USAGE
 
     # Parse extension filter
-    include_extensions = _parse_extensions(getattr(args, "include_ext", None))
+    include_extensions = _parse_extensions(ca.include_ext)
 
     # Get symlink setting
-    follow_symlinks = getattr(args, "follow_symlinks", False)
+    follow_symlinks = ca.follow_symlinks
 
     # Load policy from file or pack
     if policy:
         policy_path = Path(policy)
 
-        if not policy_path.exists():
+        # One stat up front; the loader opens without probing again
+        policy_stat = _stat_once(policy)
+        if not policy_stat.exists:
             sys.stderr.write(f"Error: Policy file not found: {policy}\n")
             return EXIT_RUNTIME
 
-        if not policy_path.is_file():
+        if not policy_stat.is_file:
             sys.stderr.write(f"Error: Policy path is not a file: {policy}\n")
             return EXIT_RUNTIME
 
@@ -209,6 +442,10 @@ def cmd_check(args: argparse.Namespace) -> int:
         except json.JSONDecodeError as e:
             sys.stderr.write(f"Error: Invalid JSON in policy file: {e}\n")
             return EXIT_RUNTIME
+        except FileNotFoundError:
+            # Removed between the stat and the open
+            sys.stderr.write(f"Error: Policy file not found: {policy}\n")
+            return EXIT_RUNTIME
     else:
         # Load from pack
         try:
@@ -222,26 +459,24 @@ def cmd_check(args: argparse.Namespace) -> int:
             return EXIT_RUNTIME
 
     # Get timestamp
-    timestamp = _get_timestamp(args.fixed_time)
+    timestamp = _get_timestamp(ca.fixed_time)
 
     # Check if single file input (backward compatible path)
-    if _is_single_file_input(existing_inputs):
-        input_path = Path(existing_inputs[0])
-
-        # Run single-file check (original behavior)
+    if _is_single_file_input(input_stats):
+        # Run single-file check (original behavior; Path only normalizes
+        # the displayed input_path)
         result = run_check(
-            input_path=str(input_path),
+            input_path=str(Path(existing_inputs[0])),
             policy_file=policy_file,
             policy_path=policy_path_str,
             generated_at_utc=timestamp,
-            apply_redaction=args.redact,
+            apply_redaction=ca.redact,
         )
     else:
         # Multi-file / directory scan path
         try:
-            input_paths = [Path(p) for p in existing_inputs]
             files, skipped = collect_targets(
-                inputs=input_paths,
+                inputs=existing_inputs,
                 include_extensions=include_extensions,
                 follow_symlinks=follow_symlinks,
                 max_files=max_files,
@@ -257,44 +492,42 @@ def cmd_check(args: argparse.Namespace) -> int:
             sys.stderr.write("Error: No files found to scan\n")
             return EXIT_RUNTIME
 
-        # Read file contents
-        file_contents: Dict[str, str] = {}
-        for file_path in files:
-            try:
-                content, was_truncated = read_file_limited(file_path, max_bytes)
-                file_contents[str(file_path)] = content
-            except ScanError as e:
-                # Skip files that can't be read, add to skipped
-                skipped.append((file_path, "read_error"))
-
         # Summarize skipped files
         skipped_summary = summarize_skipped(skipped) if skipped else None
 
-        # Run multi-file check
-        result = run_check_multi(
-            files=files,
-            file_contents=file_contents,
-            input_roots=existing_inputs,
-            policy_file=policy_file,
-            policy_path=policy_path_str,
-            generated_at_utc=timestamp,
-            apply_redaction=args.redact,
-            files_skipped_summary=skipped_summary,
-        )
+        # Run multi-file check, reading files as the scan reaches them
+        workers = max(1, min(MAX_READ_WORKERS, (os.cpu_count() or 1) * 4, len(files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            file_contents = _StreamedContents(files, max_bytes, executor, 2 * workers)
+            result = run_check_multi(
+                files=files,
+                file_contents=file_contents,
+                input_roots=existing_inputs,
+                policy_file=policy_file,
+                policy_path=policy_path_str,
+                generated_at_utc=timestamp,
+                apply_redaction=ca.redact,
+                files_skipped_summary=skipped_summary,
+            )
 
-    # Calculate violations and exit code
-    violation_count, _ = count_violations(result["findings"], fail_on)
-    exit_zero = getattr(args, "exit_zero", False)
-    exit_code = determine_exit_code(violation_count, exit_zero)
+        # Read failures are only known once the scan has read every file
+        if file_contents.failures:
+            skipped.extend(file_contents.failures)
+            result["scan_stats"]["files_skipped"] = summarize_skipped(skipped)
 
-    # Apply max_findings truncation (deterministic: findings already sorted)
-    truncated = False
-    if max_findings > 0 and len(result["findings"]) > max_findings:
-        result["findings"] = result["findings"][:max_findings]
-        truncated = True
+    # Calculate violations, exit code, and max_findings truncation
+    # (deterministic: findings already sorted by severity)
+    findings = result["findings"]
+    violation_count, findings_limit, truncated = count_and_truncate(
+        findings, fail_on, max_findings
+    )
+    exit_zero = ca.exit_zero
+    exit_code = determine_exit_code(violation_count, exit_zero)
 
     # Output based on format
     if output_format == "compliancepack.sariflite.v1":
+        if truncated:
+            result["findings"] = findings[:findings_limit]
         output = render_sariflite(
             report=result,
             fail_on=fail_on,
@@ -303,25 +536,24 @@ def cmd_check(args: argparse.Namespace) -> int:
             max_findings=max_findings,
             truncated=truncated,
         )
+        _output_json(output)
     else:
         # compliancepack.check.v1 - extend with threshold info
-        output = {
-            **result,
-            "threshold": {
-                "fail_on": fail_on,
-                "violations": violation_count,
-            },
-            "exit_code_expected": exit_code,
-            "truncated": truncated,
-            "max_findings": max_findings if max_findings > 0 else None,
+        envelope = {key: value for key, value in result.items() if key != "findings"}
+        envelope["threshold"] = {
+            "fail_on": fail_on,
+            "violations": violation_count,
         }
+        envelope["exit_code_expected"] = exit_code
+        envelope["truncated"] = truncated
+        envelope["max_findings"] = max_findings if max_findings > 0 else None
+        _output_check_report(envelope, findings, findings_limit)
 
-    _output_json(output)
     return exit_code
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+def _create_root_parser() -> Tuple[argparse.ArgumentParser, "argparse._SubParsersAction"]:
+    """Create the top-level parser and its (empty) subcommand registry."""
     parser = argparse.ArgumentParser(
         prog="compliancepack",
         description="Contract-first compliance evidence toolkit",
@@ -333,12 +565,31 @@ def create_parser() -> argparse.ArgumentParser:
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    return parser, subparsers
+
+
+def _attach_check_subparser(
+    subparsers: "argparse._SubParsersAction",
+    with_arguments: bool = True,
+) -> argparse.ArgumentParser:
+    """
+    Register the check subcommand.
 
-    # check subcommand
+    Args:
+        subparsers: Subcommand registry from _create_root_parser()
+        with_arguments: If False, register only the name and help line
+                        (enough for top-level --help and dispatch)
+
+    Returns:
+        The check subparser
+    """
     check_parser = subparsers.add_parser(
         "check",
         help="Analyze configuration files for compliance violations",
     )
+    if not with_arguments:
+        return check_parser
+
     check_parser.add_argument(
         "--input",
         action="append",
@@ -390,7 +641,7 @@ def create_parser() -> argparse.ArgumentParser:
         default="high",
         choices=SEVERITY_LEVELS,
         help=f"Severity threshold for CI failure (default: high). "
-             f"Choices: {', '.join(SEVERITY_LEVELS)}",
+             f"Choices: {SEVERITY_CHOICES_TEXT}",
     )
 
     # Output format
@@ -400,7 +651,7 @@ def create_parser() -> argparse.ArgumentParser:
         default="compliancepack.check.v1",
         choices=OUTPUT_FORMATS,
         help=f"Output format (default: compliancepack.check.v1). "
-             f"Choices: {', '.join(OUTPUT_FORMATS)}",
+             f"Choices: {OUTPUT_FORMATS_TEXT}",
     )
 
     # Max findings limit
@@ -447,28 +698,38 @@ def create_parser() -> argparse.ArgumentParser:
         help="Follow symlinks during directory traversal (default: OFF)",
     )
 
+    return check_parser
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser, subparsers = _create_root_parser()
+    _attach_check_subparser(subparsers)
     return parser
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # `check --list-packs` ignores every other option: answer it before
+    # building or running any parser
+    if argv[:1] == ["check"] and "--list-packs" in argv[1:]:
+        sys.exit(cmd_list_packs())
+
+    # Only `check` needs its full argument table; --help/--version and
+    # unknown commands just need the subcommand name registered.
+    parser, subparsers = _create_root_parser()
+    _attach_check_subparser(subparsers, with_arguments=argv[:1] == ["check"])
+    args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
         sys.exit(EXIT_OK)
 
     if args.command == "check":
-        # Handle --list-packs specially (no --input required)
-        if getattr(args, "list_packs", False):
-            sys.exit(cmd_list_packs())
-
-        # Otherwise, --input is required
-        if not args.input:
-            sys.stderr.write("Error: --input is required for check command\n")
-            sys.exit(EXIT_USAGE)
-
+        # cmd_check validates --input (required) itself
         sys.exit(cmd_check(args))
     else:
         parser.print_help()
@@ -6,29 +6,54 @@ Applies policies to input text with deterministic matching and ordering.
 Matching semantics:
 - Read input as lines with stable line numbers (1-indexed)
 - For regex: re.finditer per line
-- For contains: find substring occurrences per line
+- For contains: find substring occurrences per line (overlapping, each counted)
 - Store matches with line, col_start, col_end, excerpt
 
 Deterministic ordering (single file):
-- Findings sorted by: severity rank (asc = more severe first), then policy id
-- Matches sorted by: line asc, col_start asc
+- Findings ordered by: severity rank (asc = more severe first), then policy id
+- Matches ordered by: line asc, col_start asc
 - Samples capped by sample_limit, taking earliest matches
+- A policy with exact_count false stops scanning once its samples are
+  filled, so its match_count is at most sample_limit
 
 Deterministic ordering (multi-file):
-- Findings sorted by: severity rank desc -> id asc -> file asc -> line asc -> col_start asc
-- Samples sorted by: file asc -> line asc -> col_start asc
+- Findings ordered by: severity rank (asc) -> id asc
+- Samples ordered by: file asc -> line asc -> col_start asc
+
+None of these orders comes from a sort of matches or samples: lines are
+scanned in order, each line's hits arrive left to right, files are merged
+in path order, and findings are emitted in policy report order.
 """
 
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypedDict,
+    Union,
+)
 
 from compliancepack.policy import PolicyDict, PolicyFileDict, get_severity_rank
 from compliancepack.redact import create_excerpt
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
 
 class MatchDict(TypedDict, total=False):
-    """A single match occurrence."""
+    """
+    A single match occurrence.
+
+    Records are built only for kept samples (at most sample_limit per
+    policy); matches past the limit are counted, never materialized.
+    """
     line: int
     col_start: int
     col_end: int
@@ -74,100 +99,631 @@ class CheckResultDict(TypedDict):
     findings: List[FindingDict]
 
 
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a pattern once per process.
+
+    This cache and the per-pattern and per-needle caches below are bounded:
+    library callers of apply_policy may pass any number of hand-built
+    policies, and a bundled pack needs only a few entries.
+    """
+    return re.compile(pattern)
+
+
+def _compiled_pattern(policy: PolicyDict) -> "re.Pattern[str]":
+    """Return the loader's compiled pattern, compiling only for hand-built policies."""
+    compiled = policy.get("compiled")
+    if compiled is None:
+        compiled = _compile(policy["pattern"])
+    return compiled
+
+
+# Line boundaries str.splitlines() recognises besides "\n"
+_OTHER_LINE_BREAKS = "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+class _LineBuffer:
+    r"""
+    Lines of one input, plus their "\n"-joined text and line start offsets.
+
+    The text and offsets are built on first use, so policies that never
+    search the whole buffer pay nothing for them. The text may end with
+    one extra "\n" (see from_content); no line starts after it.
+    """
+
+    __slots__ = ("lines", "_text", "_starts", "needle_hits")
+
+    def __init__(self, lines: List[str]) -> None:
+        self.lines = lines
+        self._text: Optional[str] = None
+        self._starts: Optional[List[int]] = None
+        # (leading start offsets, occurrence count) per needle, filled by
+        # one _NeedleSet scan
+        self.needle_hits: Optional[Dict[str, Tuple[List[int], int]]] = None
+
+    @classmethod
+    def from_content(cls, content: str) -> "_LineBuffer":
+        r"""
+        Split content into lines exactly as str.splitlines() does.
+
+        When "\n" is the only line break in content, content itself is the
+        joined text, so no second copy of the input is built.
+        """
+        if any(brk in content for brk in _OTHER_LINE_BREAKS):
+            return cls(content.splitlines())
+        lines = content.split("\n")
+        if not lines[-1]:
+            lines.pop()  # splitlines() yields no line after a final break
+        buffer = cls(lines)
+        buffer._text = content
+        return buffer
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self.lines)
+        return self._text
+
+    @property
+    def starts(self) -> List[int]:
+        """Offset of each line in text (plus one past the end)."""
+        if self._starts is None:
+            self._starts = list(
+                accumulate(map((1).__add__, map(len, self.lines)), initial=0)
+            )
+        return self._starts
+
+    def line_index(self, offset: int) -> int:
+        """Index of the line containing a text offset."""
+        return bisect_right(self.starts, offset) - 1
+
+
+# Parser nodes under which a match found in one line is also found, at the
+# same offset, in the "\n"-joined buffer searched with re.MULTILINE. Anything
+# else (lookarounds, \A/\Z, atomic groups, possessive repeats, conditionals)
+# can see or consume past the line end differently, so such patterns are
+# matched line by line only.
+_BUFFER_SAFE_OPS = frozenset({
+    _sre_parse.LITERAL,
+    _sre_parse.NOT_LITERAL,
+    _sre_parse.ANY,
+    _sre_parse.IN,
+    _sre_parse.AT,
+    _sre_parse.SUBPATTERN,
+    _sre_parse.MAX_REPEAT,
+    _sre_parse.MIN_REPEAT,
+    _sre_parse.BRANCH,
+    _sre_parse.GROUPREF,
+})
+_STRING_ANCHORS = frozenset({
+    _sre_parse.AT_BEGINNING_STRING,
+    _sre_parse.AT_END_STRING,
+})
+
+
+def _buffer_safe(items: Any) -> bool:
+    """Check a parsed (sub)pattern contains only buffer-safe nodes."""
+    for op, av in items:
+        if op not in _BUFFER_SAFE_OPS:
+            return False
+        if op is _sre_parse.AT:
+            if av in _STRING_ANCHORS:
+                return False
+        elif op is _sre_parse.SUBPATTERN:
+            if not _buffer_safe(av[-1]):
+                return False
+        elif op is _sre_parse.MAX_REPEAT or op is _sre_parse.MIN_REPEAT:
+            if not _buffer_safe(av[2]):
+                return False
+        elif op is _sre_parse.BRANCH:
+            if not all(_buffer_safe(branch) for branch in av[1]):
+                return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _buffer_pattern(compiled: "re.Pattern[str]") -> Optional["re.Pattern[str]"]:
+    r"""
+    Return a whole-buffer prefilter for a per-line pattern, if one is sound.
+
+    For a buffer-safe pattern, any per-line match at line offset c is also
+    a match of the MULTILINE variant at starts[line] + c in the joined
+    buffer (^/$ match at the joins, and \b sees "\n" as it sees the string
+    edge). So the leftmost buffer match from a line start is never past
+    the first line that matches on its own. The converse does not hold
+    (e.g. \s can span lines), so candidate lines are still verified.
+    """
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except re.error:  # pragma: no cover - the pattern already compiled
+        return None
+    if not _buffer_safe(parsed):
+        return None
+    return re.compile(compiled.pattern, compiled.flags | re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _required_literal(compiled: "re.Pattern[str]") -> Optional[str]:
+    """
+    Return the longest literal run every match of the pattern contains.
+
+    Only literals in the pattern's top-level sequence (including plain
+    groups) are required; anything under a repeat or branch is optional.
+    Case-insensitive patterns have no required literal. A line that lacks
+    the literal cannot match, so it is never handed to the regex engine.
+    """
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except re.error:  # pragma: no cover - the pattern already compiled
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+
+    runs: List[str] = []
+    run: List[str] = []
+
+    def walk(items: Any) -> None:
+        for op, av in items:
+            if op is _sre_parse.LITERAL:
+                run.append(chr(av))
+            elif op is _sre_parse.SUBPATTERN and not av[1] & re.IGNORECASE:
+                walk(av[-1])
+            elif run:
+                runs.append("".join(run))
+                run.clear()
+
+    walk(parsed)
+    runs.append("".join(run))
+    return max((r for r in runs if r and "\n" not in r), key=len, default=None)
+
+
+def _make_match(
+    line: str,
+    line_num: int,
+    col_start: int,
+    col_end: int,
+    apply_redaction: bool,
+    file_path: Optional[str],
+) -> MatchDict:
+    """Build one match record (with "file" only in multi-file mode)."""
+    match: MatchDict = {
+        "line": line_num,
+        "col_start": col_start,
+        "col_end": col_end,
+        "excerpt": create_excerpt(
+            line,
+            col_start,
+            col_end,
+            apply_redaction=apply_redaction,
+        ),
+    }
+    if file_path is not None:
+        match["file"] = file_path
+    return match
+
+
+def _candidate_lines(
+    buffer: _LineBuffer,
+    searcher: "re.Pattern[str]",
+) -> Iterator[int]:
+    """
+    Yield indexes of lines that may match, in order.
+
+    Each whole-buffer search jumps straight to the next line that can
+    contain a match; runs of non-matching lines cost no Python-level work.
+    """
+    text = buffer.text
+    starts = buffer.starts
+    last_line = len(buffer.lines) - 1
+    pos = 0
+    while True:
+        found = searcher.search(text, pos)
+        if found is None:
+            return
+        line_idx = buffer.line_index(found.start())
+        if line_idx > last_line:
+            return  # Empty match after a final "\n"
+        yield line_idx
+        if line_idx == last_line:
+            return
+        pos = starts[line_idx + 1]
+
+
+def _literal_lines(buffer: _LineBuffer, literal: str) -> Iterator[int]:
+    """
+    Yield indexes of lines containing literal, in order.
+
+    str.find jumps between occurrences in C, which is cheaper than letting
+    the regex engine try a match at every offset of the lines in between.
+    """
+    text = buffer.text
+    starts = buffer.starts
+    last_line = len(buffer.lines) - 1
+    pos = text.find(literal)
+    while pos != -1:
+        line_idx = buffer.line_index(pos)
+        yield line_idx
+        if line_idx == last_line:
+            return
+        pos = text.find(literal, starts[line_idx + 1])
+
+
 def _find_regex_matches(
-    lines: List[str],
-    pattern: str,
+    buffer: _LineBuffer,
+    pattern: Union[str, "re.Pattern[str]"],
     sample_limit: int,
     apply_redaction: bool,
-) -> List[MatchDict]:
+    file_path: Optional[str] = None,
+) -> Tuple[List[MatchDict], int]:
     """
-    Find regex matches across all lines.
+    Find regex matches across all lines in a single pass.
+
+    Matching is per line. When the pattern allows it (_buffer_pattern),
+    a whole-buffer search picks the candidate lines first.
 
     Args:
-        lines: List of lines (0-indexed internally, 1-indexed in output)
-        pattern: Regex pattern to match
+        buffer: Input lines (0-indexed internally, 1-indexed in output)
+        pattern: Regex pattern to match (string or compiled)
         sample_limit: Maximum samples to return
         apply_redaction: Whether to redact excerpts
+        file_path: File path to record on each match (multi-file mode)
 
     Returns:
-        List of matches, sorted by line then col_start, capped at sample_limit
+        Tuple of (matches, total_count); matches are the earliest by line
+        then col_start, capped at sample_limit
+    """
+    compiled = pattern if isinstance(pattern, re.Pattern) else _compile(pattern)
+    return _scan_regex(
+        buffer, compiled, _buffer_pattern(compiled),
+        sample_limit, apply_redaction, file_path,
+        literal=_required_literal(compiled),
+    )
+
+
+def _scan_regex(
+    buffer: _LineBuffer,
+    compiled: "re.Pattern[str]",
+    searcher: Optional["re.Pattern[str]"],
+    sample_limit: int,
+    apply_redaction: bool,
+    file_path: Optional[str] = None,
+    count_all: bool = True,
+    literal: Optional[str] = None,
+    excerpt_limit: Optional[int] = None,
+) -> Tuple[List[MatchDict], int]:
+    """
+    _find_regex_matches with the pattern compiled and its buffer searcher
+    (_buffer_pattern(compiled), possibly None) and required literal
+    (_required_literal(compiled)) resolved by the caller. Only lines
+    holding the literal, if there is one, are matched.
+
+    With count_all False the scan stops once sample_limit matches are
+    counted, and total_count is at most sample_limit. excerpt_limit (at
+    most sample_limit; None: sample_limit) bounds the samples built, never
+    what is counted.
     """
-    compiled = re.compile(pattern)
     matches: List[MatchDict] = []
-
-    for line_idx, line in enumerate(lines):
-        line_num = line_idx + 1  # 1-indexed
+    total_count = 0
+    lines = buffer.lines
+    if not lines or (not count_all and sample_limit <= 0):
+        return matches, total_count
+    if excerpt_limit is None or excerpt_limit > sample_limit:
+        excerpt_limit = sample_limit
+
+    candidates: Iterable[int]
+    if literal:
+        candidates = _literal_lines(buffer, literal)
+    elif searcher is not None:
+        candidates = _candidate_lines(buffer, searcher)
+    else:
+        candidates = range(len(lines))
+
+    findall = compiled.findall
+    for line_idx in candidates:
+        line = lines[line_idx]
+        if len(matches) >= excerpt_limit:
+            # Samples are full: count the rest without match objects
+            total_count += len(findall(line))
+            if not count_all and total_count >= sample_limit:
+                return matches, sample_limit
+            continue
         for match in compiled.finditer(line):
-            matches.append({
-                "line": line_num,
-                "col_start": match.start(),
-                "col_end": match.end(),
-                "excerpt": create_excerpt(
-                    line,
-                    match.start(),
-                    match.end(),
-                    apply_redaction=apply_redaction,
-                ),
-            })
+            total_count += 1
+            if len(matches) < excerpt_limit:
+                matches.append(_make_match(
+                    line, line_idx + 1, match.start(), match.end(),
+                    apply_redaction, file_path,
+                ))
+            if not count_all and total_count == sample_limit:
+                return matches, total_count
+
+    return matches, total_count
+
 
-    # Sort by line, then col_start for deterministic ordering
-    matches.sort(key=lambda m: (m["line"], m["col_start"]))
+# Runs with at least this many distinct contains needles scan each file
+# once with an Aho-Corasick automaton (when pyahocorasick is installed)
+NEEDLE_SET_MIN_NEEDLES = 2
 
-    # Cap at sample_limit
-    return matches[:sample_limit]
+
+class _NeedleSet:
+    """
+    One Aho-Corasick automaton over the contains needles of a run.
+
+    pyahocorasick is an optional accelerator, not a dependency: without
+    it, each needle is found with its own str.find loop.
+    """
+
+    __slots__ = ("_automaton", "_keep")
+
+    def __init__(self, automaton: Any, keep: Optional[int] = None) -> None:
+        self._automaton = automaton
+        self._keep = keep
+
+    @classmethod
+    def build(
+        cls,
+        needles: Iterable[str],
+        keep: Optional[int] = None,
+    ) -> Optional["_NeedleSet"]:
+        r"""
+        Build a needle set, or None if it would not pay off or is unavailable.
+
+        Needles that are empty or contain "\n" are left out; they are
+        matched line by line. Only the first keep offsets of each needle
+        are recorded (all of them if keep is None); the rest are counted.
+        """
+        words = sorted({n for n in needles if n and "\n" not in n})
+        if len(words) < NEEDLE_SET_MIN_NEEDLES:
+            return None
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            # Each hit carries its needle and the distance from its last
+            # character back to its start
+            automaton.add_word(word, (word, len(word) - 1))
+        automaton.make_automaton()
+        return cls(automaton, keep)
+
+    def __contains__(self, needle: str) -> bool:
+        return needle in self._automaton
+
+    def positions(self, buffer: _LineBuffer, needle: str) -> Tuple[List[int], int]:
+        """
+        Leading start offsets of needle in the buffer text, and its count.
+
+        The offsets are ascending and capped at keep. The first call for a
+        buffer scans it once for every needle; later calls (the other
+        contains policies) reuse that scan.
+        """
+        hits = buffer.needle_hits
+        if hits is None:
+            keep = self._keep
+            offsets: Dict[str, List[int]] = {}
+            counts: Dict[str, int] = {}
+            for end, (word, back) in self._automaton.iter(buffer.text):
+                seen = counts.get(word, 0)
+                counts[word] = seen + 1
+                if keep is None or seen < keep:
+                    if seen:
+                        offsets[word].append(end - back)
+                    else:
+                        offsets[word] = [end - back]
+            hits = {word: (offsets.get(word, []), count) for word, count in counts.items()}
+            buffer.needle_hits = hits
+        return hits.get(needle, ([], 0))
+
+
+def _find_all(text: str, needle: str, start: int = 0) -> Iterator[int]:
+    """Yield start offsets of needle in text, overlapping occurrences included."""
+    pos = text.find(needle, start)
+    while pos != -1:
+        yield pos
+        pos = text.find(needle, pos + 1)  # Continue after this match
+
+
+@lru_cache(maxsize=256)
+def _overlap_counter(needle: str) -> Optional["re.Pattern[str]"]:
+    """
+    Return a zero-width pattern hitting at each occurrence of needle, or
+    None if occurrences of needle cannot overlap (it has no border).
+    """
+    if not any(needle[:k] == needle[-k:] for k in range(1, len(needle))):
+        return None
+    return re.compile(f"(?={re.escape(needle)})")
+
+
+def _count_from(text: str, needle: str, start: int) -> int:
+    """
+    Count overlapping occurrences of needle in text[start:], in C.
+
+    str.count skips past each hit, so it only agrees with the overlapping
+    count when no prefix of needle is also a suffix. Other needles are
+    counted by findall of a lookahead, which advances one character per
+    hit as the find loop does.
+    """
+    counter = _overlap_counter(needle)
+    if counter is None:
+        return text.count(needle, start)
+    return len(counter.findall(text, start))
 
 
 def _find_contains_matches(
-    lines: List[str],
+    buffer: _LineBuffer,
     needle: str,
     sample_limit: int,
     apply_redaction: bool,
-) -> List[MatchDict]:
-    """
-    Find substring occurrences across all lines.
+    file_path: Optional[str] = None,
+    needle_set: Optional[_NeedleSet] = None,
+    count_all: bool = True,
+    excerpt_limit: Optional[int] = None,
+) -> Tuple[List[MatchDict], int]:
+    r"""
+    Find substring occurrences across all lines in a single pass.
+
+    Occurrences may overlap (the search resumes one character after each
+    hit), and every occurrence is counted. A needle without "\n" cannot
+    span the joins, so it is searched in the joined buffer and each hit is
+    mapped back to its line and column; one with "\n" can never match a
+    line, so nothing is scanned for it.
 
     Args:
-        lines: List of lines (0-indexed internally, 1-indexed in output)
+        buffer: Input lines (0-indexed internally, 1-indexed in output)
         needle: Substring to find
         sample_limit: Maximum samples to return
         apply_redaction: Whether to redact excerpts
+        file_path: File path to record on each match (multi-file mode)
+        needle_set: Shared automaton holding needle, if the run built one
+        count_all: False stops at sample_limit occurrences instead of
+                   counting every one
+        excerpt_limit: Samples to build (at most sample_limit; None:
+                       sample_limit); does not change total_count
 
     Returns:
-        List of matches, sorted by line then col_start, capped at sample_limit
+        Tuple of (matches, total_count); matches are the earliest by line
+        then col_start, capped at excerpt_limit
     """
     matches: List[MatchDict] = []
+    total_count = 0
+    needle_len = len(needle)
+    lines = buffer.lines
+    sample_limit = max(sample_limit, 0)
+    if excerpt_limit is None or excerpt_limit > sample_limit:
+        excerpt_limit = sample_limit
+
+    if "\n" in needle:
+        return matches, total_count  # Lines never contain "\n"
+
+    if not needle:
+        # The empty needle matches at every column 0..len(line) of each
+        # line, so only the kept samples are visited and the rest is summed
+        # (line numbers are 1-indexed)
+        offsets = (
+            (line, line_num, col)
+            for line_num, line in enumerate(lines, 1)
+            for col in range(len(line) + 1)
+        )
+        for line, line_num, col in islice(offsets, max(excerpt_limit, 0)):
+            matches.append(_make_match(
+                line, line_num, col, col, apply_redaction, file_path,
+            ))
+        total_count = sum(map(len, lines)) + len(lines)
+        return matches, total_count if count_all else min(total_count, sample_limit)
+
+    if needle_set is not None and needle in needle_set:
+        positions, found = needle_set.positions(buffer, needle)
+        kept = positions[:excerpt_limit]
+        total_count = found if count_all else min(found, sample_limit)
+    else:
+        text = buffer.text
+        positions = list(islice(_find_all(text, needle), sample_limit))
+        total_count = len(positions)
+        if count_all and total_count == sample_limit:
+            # Samples are full: count the rest without walking it in Python
+            total_count += _count_from(text, needle, positions[-1] + 1 if positions else 0)
+        kept = positions[:excerpt_limit]
+
+    for pos in kept:
+        line_idx = buffer.line_index(pos)
+        col_start = pos - buffer.starts[line_idx]
+        matches.append(_make_match(
+            lines[line_idx], line_idx + 1, col_start, col_start + needle_len,
+            apply_redaction, file_path,
+        ))
+
+    return matches, total_count
+
 
-    for line_idx, line in enumerate(lines):
-        line_num = line_idx + 1  # 1-indexed
-        start = 0
-        while True:
-            pos = line.find(needle, start)
-            if pos == -1:
-                break
-            matches.append({
-                "line": line_num,
-                "col_start": pos,
-                "col_end": pos + len(needle),
-                "excerpt": create_excerpt(
-                    line,
-                    pos,
-                    pos + len(needle),
-                    apply_redaction=apply_redaction,
-                ),
-            })
-            start = pos + 1  # Continue searching after this match
-
-    # Sort by line, then col_start for deterministic ordering
-    matches.sort(key=lambda m: (m["line"], m["col_start"]))
-
-    # Cap at sample_limit
-    return matches[:sample_limit]
+# A policy bound to its compiled pattern or needle, sample limit and
+# exact_count: matcher(buffer, apply_redaction=..., file_path=...)
+# -> (matches, total)
+PolicyMatcher = Callable[..., Tuple[List[MatchDict], int]]
+
+
+def _no_matches(*args: Any, **kwargs: Any) -> Tuple[List[MatchDict], int]:
+    """Matcher for an unknown policy type."""
+    return [], 0
+
+
+def _policy_matchers(policies: List[PolicyDict]) -> List[PolicyMatcher]:
+    """
+    Resolve each policy to its matcher once per run, not once per file.
+
+    A regex matcher is bound to its compiled pattern, whole-buffer
+    searcher and required literal, so per-file calls do no cache lookups.
+
+    Policies stay separate searches rather than one alternation of all
+    patterns: an alternation reports only the leftmost policy at each
+    offset (losing overlapping hits of other policies), renumbers groups
+    under backreferences, and defeats re's literal-prefix scans, so it
+    runs slower than the individual whole-buffer searches.
+
+    Returns:
+        One matcher per policy, aligned with policies
+    """
+    contains = [policy for policy in policies if policy["type"] == "contains"]
+    # No matcher call asks for more samples than its policy's sample_limit
+    needle_set = _NeedleSet.build(
+        (policy["needle"] for policy in contains),
+        keep=max((policy["sample_limit"] for policy in contains), default=0),
+    )
+    matchers: List[PolicyMatcher] = []
+    for policy in policies:
+        if policy["type"] == "regex":
+            compiled = _compiled_pattern(policy)
+            matchers.append(partial(
+                _scan_regex,
+                compiled=compiled,
+                searcher=_buffer_pattern(compiled),
+                sample_limit=policy["sample_limit"],
+                count_all=policy.get("exact_count", True),
+                literal=_required_literal(compiled),
+            ))
+        elif policy["type"] == "contains":
+            matchers.append(partial(
+                _find_contains_matches,
+                needle=policy["needle"],
+                sample_limit=policy["sample_limit"],
+                needle_set=needle_set,
+                count_all=policy.get("exact_count", True),
+            ))
+        else:
+            # Unknown type - should not happen if validation is correct
+            matchers.append(_no_matches)
+    return matchers
+
+
+def _match_policy(
+    buffer: _LineBuffer,
+    policy: PolicyDict,
+    apply_redaction: bool,
+    file_path: Optional[str] = None,
+    count_all: bool = True,
+) -> Tuple[List[MatchDict], int]:
+    """
+    Apply a single policy to buffered lines, dispatching on policy type.
+
+    Returns:
+        Tuple of (matches, total_count); ([], 0) for an unknown type
+    """
+    matcher = _policy_matchers([policy])[0]
+    return matcher(
+        buffer,
+        apply_redaction=apply_redaction,
+        file_path=file_path,
+        count_all=count_all and policy.get("exact_count", True),
+    )
 
 
 def apply_policy(
     lines: List[str],
     policy: PolicyDict,
     apply_redaction: bool,
+    count_all: bool = True,
 ) -> Optional[FindingDict]:
     """
     Apply a single policy to input lines.
@@ -176,56 +732,62 @@ def apply_policy(
         lines: List of lines from input file
         policy: Policy to apply
         apply_redaction: Whether to redact excerpts
+        count_all: False stops once sample_limit matches are found, so
+                   match_count is at most sample_limit (a policy with
+                   exact_count false always does this)
 
     Returns:
         FindingDict if matches found, None otherwise
     """
-    sample_limit = policy["sample_limit"]
+    matches, total_count = _match_policy(
+        _LineBuffer(lines), policy, apply_redaction, count_all=count_all
+    )
 
-    if policy["type"] == "regex":
-        matches = _find_regex_matches(
-            lines,
-            policy["pattern"],
-            sample_limit,
-            apply_redaction,
-        )
-    elif policy["type"] == "contains":
-        matches = _find_contains_matches(
-            lines,
-            policy["needle"],
-            sample_limit,
-            apply_redaction,
-        )
-    else:
-        # Unknown type - should not happen if validation is correct
+    if not total_count:
         return None
 
-    if not matches:
-        return None
+    return _build_finding(policy, matches, total_count)
 
-    # Count total matches (before sample_limit truncation)
-    # Re-count without limit to get accurate count
-    if policy["type"] == "regex":
-        total_matches = sum(
-            len(list(re.finditer(policy["pattern"], line)))
-            for line in lines
-        )
-    else:
-        total_matches = sum(
-            line.count(policy["needle"])
-            for line in lines
-        )
 
+def _build_finding(
+    policy: PolicyDict,
+    matches: List[MatchDict],
+    total_count: int,
+) -> FindingDict:
+    """Build the single-file finding for a policy that matched."""
     return {
         "id": policy["id"],
         "title": policy["title"],
         "severity": policy["severity"],
         "description": policy["description"],
-        "match_count": total_matches,
+        "match_count": total_count,
         "samples": matches,
     }
 
 
+def _read_input(input_path: str) -> str:
+    """
+    Read a single input file as strict UTF-8, in one unbuffered read.
+
+    Not decoded from a memory map: a file truncated while it is scanned
+    (log rotation with copytruncate) would fault with SIGBUS when a page
+    past its new end is touched, where a read just returns fewer bytes.
+    """
+    with open(input_path, "rb", buffering=0) as f:
+        return f.read().decode("utf-8")
+
+
+def _report_order(policies: List[PolicyDict]) -> List[int]:
+    """
+    Return policy indexes in finding order: severity rank, then id.
+
+    Ranks are looked up once per policy, so findings built in this order
+    need no sort of their own.
+    """
+    keys = [(get_severity_rank(policy["severity"]), policy["id"]) for policy in policies]
+    return sorted(range(len(policies)), key=keys.__getitem__)
+
+
 def run_check(
     input_path: str,
     policy_file: PolicyFileDict,
@@ -246,21 +808,20 @@ def run_check(
     Returns:
         Complete CheckResultDict ready for JSON serialization
     """
-    # Read input file
-    with open(input_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Decode the input in one step (no text layer); splitlines() treats
+    # \r\n and \r as universal newlines do
+    content = _read_input(input_path)
 
-    lines = content.splitlines()
+    policies = policy_file["policies"]
+    results = _scan_input(content, policies, apply_redaction)
 
-    # Apply each policy
+    # Collect findings in report order (most severe first, then by id),
+    # so they are appended already sorted
     findings: List[FindingDict] = []
-    for policy in policy_file["policies"]:
-        finding = apply_policy(lines, policy, apply_redaction)
-        if finding:
-            findings.append(finding)
-
-    # Sort findings by severity (most severe first), then by id
-    findings.sort(key=lambda f: (get_severity_rank(f["severity"]), f["id"]))
+    for index in _report_order(policies):
+        matches, total_count = results[index]
+        if total_count:
+            findings.append(_build_finding(policies[index], matches, total_count))
 
     # Calculate severity counts
     severity_counts: SeverityCountsDict = {
@@ -291,111 +852,250 @@ def run_check(
     }
 
 
-def _find_regex_matches_with_file(
-    lines: List[str],
-    pattern: str,
-    sample_limit: int,
-    apply_redaction: bool,
+def apply_policy_to_file(
+    content: Union[str, List[str]],
     file_path: str,
+    policy: PolicyDict,
+    apply_redaction: bool,
 ) -> Tuple[List[MatchDict], int]:
     """
-    Find regex matches across all lines, including file path in each match.
+    Apply a single policy to file content.
+
+    Args:
+        content: File content, or its lines as str.splitlines() returns
+                 them (split once when applying several policies to a file)
+        file_path: File path to record on each match
+        policy: Policy to apply
+        apply_redaction: Whether to redact excerpts
 
     Returns:
         Tuple of (matches, total_count)
     """
-    compiled = re.compile(pattern)
-    matches: List[MatchDict] = []
-    total_count = 0
+    buffer = (
+        _LineBuffer(content) if isinstance(content, list)
+        else _LineBuffer.from_content(content)
+    )
+    return _match_policy(buffer, policy, apply_redaction, file_path)
+
+
+# Scans of at least this many files are sharded across worker processes;
+# below it, pool start-up and pickling cost more than the parallel speedup
+PARALLEL_MIN_FILES = 256
+# Single inputs of at least this many characters are split into runs of
+# lines scanned in worker processes
+PARALLEL_MIN_CHARS = 8 * 1024 * 1024
+MAX_SCAN_WORKERS = 32
+# Largest number of files sent to a worker at once; smaller batches get
+# smaller chunks so every worker receives several (tail balancing)
+SCAN_CHUNKSIZE = 32
+
+# (policy index, capped matches, total match count) for each policy that hit
+FileHits = List[Tuple[int, List[MatchDict], int]]
+
+
+def _scan_file(
+    content: Union[str, List[str]],
+    file_path: Optional[str],
+    matchers: List[PolicyMatcher],
+    apply_redaction: bool,
+    excerpt_limits: Optional[List[int]] = None,
+) -> FileHits:
+    """
+    Apply every policy to one file, keeping only policies that matched.
 
-    for line_idx, line in enumerate(lines):
-        line_num = line_idx + 1
-        for match in compiled.finditer(line):
-            total_count += 1
-            if len(matches) < sample_limit:
-                matches.append({
-                    "file": file_path,
-                    "line": line_num,
-                    "col_start": match.start(),
-                    "col_end": match.end(),
-                    "excerpt": create_excerpt(
-                        line,
-                        match.start(),
-                        match.end(),
-                        apply_redaction=apply_redaction,
-                    ),
-                })
+    Args:
+        content: File content, or its lines as str.splitlines() returns them
+        file_path: File path to record on each match (None: no "file" key)
+        excerpt_limits: Samples still wanted per policy: excerpts are only
+                        built for samples that can still be kept (counts,
+                        and so whether the file hit, are unaffected)
+    """
+    hits: FileHits = []
+    buffer = (
+        _LineBuffer(content) if isinstance(content, list)
+        else _LineBuffer.from_content(content)
+    )
+    for index, matcher in enumerate(matchers):
+        if excerpt_limits is None:
+            matches, total_count = matcher(
+                buffer, apply_redaction=apply_redaction, file_path=file_path
+            )
+        else:
+            matches, total_count = matcher(
+                buffer,
+                apply_redaction=apply_redaction,
+                file_path=file_path,
+                excerpt_limit=excerpt_limits[index],
+            )
+        if total_count > 0:
+            hits.append((index, matches, total_count))
+    return hits
 
-    return matches, total_count
 
+# Per-worker-process state, set once by _init_scan_worker
+_worker_matchers: List[PolicyMatcher] = []
+_worker_redaction = True
 
-def _find_contains_matches_with_file(
-    lines: List[str],
-    needle: str,
-    sample_limit: int,
-    apply_redaction: bool,
-    file_path: str,
-) -> Tuple[List[MatchDict], int]:
+
+def _init_scan_worker(policies: List[PolicyDict], apply_redaction: bool) -> None:
     """
-    Find substring occurrences across all lines, including file path in each match.
+    Worker initializer: receive the policies once per process.
 
-    Returns:
-        Tuple of (matches, total_count)
+    Loader-built policies carry their compiled patterns (a pickled pattern
+    is recompiled once on arrival); hand-built ones are compiled here.
     """
-    matches: List[MatchDict] = []
-    total_count = 0
+    global _worker_matchers, _worker_redaction
+    _worker_matchers = _policy_matchers(policies)
+    _worker_redaction = apply_redaction
 
-    for line_idx, line in enumerate(lines):
-        line_num = line_idx + 1
-        start = 0
-        while True:
-            pos = line.find(needle, start)
-            if pos == -1:
-                break
-            total_count += 1
-            if len(matches) < sample_limit:
-                matches.append({
-                    "file": file_path,
-                    "line": line_num,
-                    "col_start": pos,
-                    "col_end": pos + len(needle),
-                    "excerpt": create_excerpt(
-                        line,
-                        pos,
-                        pos + len(needle),
-                        apply_redaction=apply_redaction,
-                    ),
-                })
-            start = pos + 1
 
-    return matches, total_count
+def _scan_file_in_worker(item: Tuple[str, str]) -> FileHits:
+    """Scan one (file_path, content) pair inside a worker process."""
+    file_path, content = item
+    return _scan_file(content, file_path, _worker_matchers, _worker_redaction)
 
 
-def apply_policy_to_file(
+def _available_cpus() -> int:
+    """CPUs this process may run on (its affinity mask, where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not Linux
+        return os.cpu_count() or 1
+
+
+def _scan_chunksize(item_count: int, workers: int) -> int:
+    """Files per worker task: about four tasks per worker, at most SCAN_CHUNKSIZE."""
+    return max(1, min(SCAN_CHUNKSIZE, item_count // (4 * workers)))
+
+
+def _scan_files(
+    items: Iterable[Tuple[str, str]],
+    item_count: int,
+    policies: List[PolicyDict],
+    apply_redaction: bool,
+    excerpt_limits: Optional[List[int]] = None,
+) -> Iterator[FileHits]:
+    """
+    Scan files, in worker processes when the batch is large enough.
+
+    Regex matching is CPU-bound and holds the GIL, so only processes scale
+    it. Results come back in input order either way; if a pool cannot be
+    started (e.g. no multiprocessing support), the scan runs serially.
+    A serial scan draws items one at a time, so a lazy items iterable only
+    ever has one file's content alive, and it reads excerpt_limits afresh
+    for each file: a caller lowering them between files stops excerpts
+    being built for samples it would discard. Workers build each policy's
+    full sample_limit; counts are the same on both paths.
+
+    Yields:
+        Hits per file, aligned with items
+    """
+    workers = min(_available_cpus(), MAX_SCAN_WORKERS)
+    if workers > 1 and item_count >= PARALLEL_MIN_FILES:
+        items = list(items)  # Kept for the serial fallback
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scan_worker,
+                initargs=(policies, apply_redaction),
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _scan_file_in_worker,
+                        items,
+                        chunksize=_scan_chunksize(item_count, workers),
+                    )
+                )
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+        else:
+            yield from results
+            return
+
+    matchers = _policy_matchers(policies)
+    for file_path, content in items:
+        yield _scan_file(content, file_path, matchers, apply_redaction, excerpt_limits)
+
+
+def _scan_lines_in_worker(chunk: Tuple[int, List[str]]) -> FileHits:
+    """Scan a run of lines (index of its first line, lines) inside a worker."""
+    first_line, lines = chunk
+    hits = _scan_file(lines, None, _worker_matchers, _worker_redaction)
+    if first_line:
+        for _, matches, _ in hits:
+            for match in matches:
+                match["line"] += first_line
+    return hits
+
+
+def _scan_input(
     content: str,
-    file_path: str,
-    policy: PolicyDict,
+    policies: List[PolicyDict],
     apply_redaction: bool,
-) -> Tuple[List[MatchDict], int]:
+) -> List[Tuple[List[MatchDict], int]]:
     """
-    Apply a single policy to file content.
+    Apply every policy to one input, in worker processes when it is large.
+
+    Matches never span lines, so a large input is split into contiguous
+    runs of lines, one run per worker task, and the per-run results are
+    merged in line order: the first sample_limit samples are kept and the
+    counts summed (a policy with exact_count false keeps its samples as
+    its count). Small inputs, single-CPU hosts, and hosts where a pool
+    cannot be started scan serially, with identical results.
 
     Returns:
-        Tuple of (matches, total_count)
+        (matches, total_count) per policy, aligned with policies
+    """
+    buffer = _LineBuffer.from_content(content)
+    lines = buffer.lines
+    workers = min(_available_cpus(), MAX_SCAN_WORKERS)
+    if workers > 1 and len(content) >= PARALLEL_MIN_CHARS and len(lines) > 1:
+        run_length = -(-len(lines) // (4 * workers))
+        chunks = [
+            (start, lines[start:start + run_length])
+            for start in range(0, len(lines), run_length)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scan_worker,
+                initargs=(policies, apply_redaction),
+            ) as executor:
+                chunk_hits = list(executor.map(_scan_lines_in_worker, chunks))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+        else:
+            merged: List[Tuple[List[MatchDict], int]] = [([], 0) for _ in policies]
+            for hits in chunk_hits:
+                for index, matches, total_count in hits:
+                    kept, count = merged[index]
+                    kept.extend(matches[:policies[index]["sample_limit"] - len(kept)])
+                    merged[index] = (kept, count + total_count)
+            return [
+                (kept, count if policy.get("exact_count", True) else len(kept))
+                for policy, (kept, count) in zip(policies, merged)
+            ]
+
+    matchers = _policy_matchers(policies)
+    return [matcher(buffer, apply_redaction=apply_redaction) for matcher in matchers]
+
+
+def _ordered_pairs(
+    pairs: Iterable[Tuple[str, str]], keys: List[str]
+) -> Iterator[Tuple[str, str]]:
     """
-    lines = content.splitlines()
-    sample_limit = policy["sample_limit"]
+    Pass (path string, content) pairs through, checking they follow keys.
 
-    if policy["type"] == "regex":
-        return _find_regex_matches_with_file(
-            lines, policy["pattern"], sample_limit, apply_redaction, file_path
-        )
-    elif policy["type"] == "contains":
-        return _find_contains_matches_with_file(
-            lines, policy["needle"], sample_limit, apply_redaction, file_path
-        )
-    else:
-        return [], 0
+    Raises:
+        ValueError: If a pair is missing or out of order
+    """
+    it = iter(pairs)
+    for key in keys:
+        pair = next(it, None)
+        if pair is None or pair[0] != key:
+            found = "end of contents" if pair is None else pair[0]
+            raise ValueError(f"File contents out of scan order: expected {key}, got {found}")
+        yield pair
 
 
 class MultiFileCheckResult(TypedDict):
@@ -412,7 +1112,7 @@ class MultiFileCheckResult(TypedDict):
 
 def run_check_multi(
     files: List[Path],
-    file_contents: Dict[str, str],
+    file_contents: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
     input_roots: List[str],
     policy_file: PolicyFileDict,
     policy_path: str,
@@ -424,8 +1124,13 @@ def run_check_multi(
     Run compliance check on multiple files.
 
     Args:
-        files: List of file paths to check (sorted, canonical)
-        file_contents: Dict mapping file path string to content
+        files: List of file paths to check (canonical; scanned in path
+               string order, as collect_targets returns them)
+        file_contents: Mapping of file path string to content (a missing
+                       file scans as empty), or an iterable of (path
+                       string, content) pairs for exactly these files in
+                       scan order, drawn one at a time as they are
+                       scanned; pairs out of that order raise ValueError
         input_roots: Original input paths (for output)
         policy_file: Loaded and validated policy file
         policy_path: Original path to policy file (for output)
@@ -440,59 +1145,61 @@ def run_check_multi(
     # Key: policy_id -> aggregated finding
     policy_findings: Dict[str, Dict[str, Any]] = {}
 
-    files_scanned = 0
+    policies = policy_file["policies"]
+    # Scanning in path-string order appends each finding's samples already
+    # sorted by file -> line -> col_start (files usually arrive sorted)
+    file_keys = sorted(map(str, files))
+    items: Iterable[Tuple[str, str]]
+    if isinstance(file_contents, Mapping):
+        items = ((key, file_contents.get(key, "")) for key in file_keys)
+    else:
+        items = _ordered_pairs(file_contents, file_keys)
+    files_scanned = len(file_keys)
     files_with_findings = 0
-
-    for file_path in files:
-        file_str = str(file_path)
-        content = file_contents.get(file_str, "")
-        files_scanned += 1
-        file_had_finding = False
-
-        for policy in policy_file["policies"]:
-            matches, total_count = apply_policy_to_file(
-                content, file_str, policy, apply_redaction
-            )
-
-            if total_count > 0:
-                file_had_finding = True
-                policy_id = policy["id"]
-
-                if policy_id not in policy_findings:
-                    policy_findings[policy_id] = {
-                        "id": policy_id,
-                        "title": policy["title"],
-                        "severity": policy["severity"],
-                        "description": policy["description"],
-                        "match_count": 0,
-                        "samples": [],
-                    }
-
-                policy_findings[policy_id]["match_count"] += total_count
-                # Add samples up to limit
-                current_samples = policy_findings[policy_id]["samples"]
-                remaining = policy["sample_limit"] - len(current_samples)
-                if remaining > 0:
-                    policy_findings[policy_id]["samples"].extend(matches[:remaining])
-
-        if file_had_finding:
+    # Samples each policy still has room for, lowered as files are merged
+    samples_wanted = [policy["sample_limit"] for policy in policies]
+
+    # Merge per-file hits in file order (deterministic regardless of workers)
+    for hits in _scan_files(
+        items, files_scanned, policies, apply_redaction, samples_wanted
+    ):
+        if hits:
             files_with_findings += 1
 
-    # Convert to list and sort
-    findings: List[FindingDict] = list(policy_findings.values())
-
-    # Sort samples within each finding: file -> line -> col_start
-    for finding in findings:
-        finding["samples"].sort(
-            key=lambda m: (m.get("file", ""), m["line"], m["col_start"])
-        )
-
-    # Sort findings: severity rank (lower = more severe) -> id -> first file
-    def finding_sort_key(f: Dict) -> Tuple:
-        first_file = f["samples"][0]["file"] if f["samples"] else ""
-        return (get_severity_rank(f["severity"]), f["id"], first_file)
-
-    findings.sort(key=finding_sort_key)
+        for index, matches, total_count in hits:
+            policy = policies[index]
+            policy_id = policy["id"]
+
+            if policy_id not in policy_findings:
+                policy_findings[policy_id] = {
+                    "id": policy_id,
+                    "title": policy["title"],
+                    "severity": policy["severity"],
+                    "description": policy["description"],
+                    "match_count": 0,
+                    "samples": [],
+                }
+
+            policy_findings[policy_id]["match_count"] += total_count
+            if not policy.get("exact_count", True):
+                # An inexact count stops at the samples kept, as in run_check
+                policy_findings[policy_id]["match_count"] = min(
+                    policy_findings[policy_id]["match_count"], policy["sample_limit"]
+                )
+            # Add samples up to limit
+            remaining = samples_wanted[index]
+            if remaining > 0:
+                kept = matches[:remaining]
+                policy_findings[policy_id]["samples"].extend(kept)
+                samples_wanted[index] = remaining - len(kept)
+
+    # Emit findings in report order: severity rank (lower = more severe)
+    # -> id (ids are unique, so no further tie-break is needed)
+    findings: List[FindingDict] = [
+        policy_findings[policies[index]["id"]]
+        for index in _report_order(policies)
+        if policies[index]["id"] in policy_findings
+    ]
 
     # Calculate severity counts
     severity_counts: SeverityCountsDict = {
@@ -9,8 +9,9 @@ Pack names must be strict identifiers (no path separators, no traversal).
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from compliancepack.policy import PolicyFileDict, load_policy_file
 
@@ -64,11 +65,18 @@ def list_packs() -> List[str]:
         Sorted list of pack names (without .json extension)
 
     The list is deterministic (alphabetically sorted) for reproducibility.
+    The directory is scanned once per process; see clear_pack_cache().
     """
+    return list(_list_pack_names())
+
+
+@lru_cache(maxsize=None)
+def _list_pack_names() -> Tuple[str, ...]:
+    """Scan the packs directory (cached; packs are read-only at runtime)."""
     packs_dir = _get_packs_dir()
 
     if not packs_dir.exists():
-        return []
+        return ()
 
     packs = []
     for path in packs_dir.glob("*.json"):
@@ -80,7 +88,7 @@ def list_packs() -> List[str]:
     # Sort for deterministic ordering
     packs.sort()
 
-    return packs
+    return tuple(packs)
 
 
 def load_pack(name: str) -> PolicyFileDict:
@@ -95,23 +103,48 @@ def load_pack(name: str) -> PolicyFileDict:
 
     Raises:
         PackError: If pack name is invalid or pack not found
+
+    Each pack is read and validated once per process, and again only if
+    its file's modification time changes. Callers get their own copy of
+    the policy file, so mutating it does not leak into later loads.
     """
     _validate_pack_name(name)
 
+    try:
+        mtime_ns = (_get_packs_dir() / f"{name}.json").stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1  # Missing: the load below reports it
+    cached = _load_pack_cached(name, mtime_ns)
+    return {
+        "schema_version": cached["schema_version"],
+        "policies": [dict(policy) for policy in cached["policies"]],
+    }
+
+
+@lru_cache(maxsize=128)
+def _load_pack_cached(name: str, mtime_ns: int) -> PolicyFileDict:
+    """
+    Load and validate a pack (cached; name must already be validated).
+
+    mtime_ns is only part of the cache key, so an edited pack is reloaded.
+    """
     packs_dir = _get_packs_dir()
     pack_path = packs_dir / f"{name}.json"
 
-    if not pack_path.exists():
-        available = list_packs()
-        if available:
-            raise PackError(
-                f"Pack '{name}' not found. Available packs: {', '.join(available)}"
-            )
-        else:
-            raise PackError(f"Pack '{name}' not found. No packs available.")
+    # Use the standard policy loader for validation; a missing pack
+    # surfaces as the open() failure rather than a separate exists() probe
+    try:
+        return load_policy_file(pack_path)
+    except FileNotFoundError:
+        pass
 
-    # Use the standard policy loader for validation
-    return load_policy_file(pack_path)
+    available = list_packs()
+    if available:
+        raise PackError(
+            f"Pack '{name}' not found. Available packs: {', '.join(available)}"
+        )
+    else:
+        raise PackError(f"Pack '{name}' not found. No packs available.")
 
 
 def get_pack_path(name: str) -> Path:
@@ -136,3 +169,9 @@ def get_pack_path(name: str) -> Path:
         raise PackError(f"Pack '{name}' not found")
 
     return pack_path
+
+
+def clear_pack_cache() -> None:
+    """Forget cached pack listings and loaded packs (e.g. after packs change)."""
+    _list_pack_names.cache_clear()
+    _load_pack_cached.cache_clear()
@@ -15,7 +15,8 @@ Schema v1:
       "pattern": "...",      // for type=regex
       "needle": "...",       // for type=contains
       "description": "...",
-      "sample_limit": 3
+      "sample_limit": 3,
+      "exact_count": true    // optional; false stops counting at sample_limit
     }
   ]
 }
@@ -23,12 +24,13 @@ Schema v1:
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TypedDict, Union
 
 
-class PolicyDict(TypedDict):
-    """A single policy definition."""
+class _PolicyFields(TypedDict):
+    """Fields every policy definition carries."""
     id: str
     title: str
     severity: str
@@ -39,6 +41,12 @@ class PolicyDict(TypedDict):
     sample_limit: int
 
 
+class PolicyDict(_PolicyFields, total=False):
+    """A single policy definition."""
+    compiled: "re.Pattern[str]"  # Set by the loader for type=regex
+    exact_count: bool  # Set by the loader; absent means True
+
+
 class PolicyFileDict(TypedDict):
     """Complete policy file structure."""
     schema_version: str
@@ -48,6 +56,9 @@ class PolicyFileDict(TypedDict):
 # Valid severity levels in ranking order (highest to lowest)
 SEVERITY_LEVELS = ("critical", "high", "medium", "low", "info")
 
+# Severity -> rank, for get_severity_rank
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_LEVELS)}
+
 # Valid policy types
 POLICY_TYPES = ("regex", "contains")
 
@@ -108,9 +119,9 @@ def _validate_policy(policy: Dict[str, Any], index: int) -> PolicyDict:
             raise PolicyValidationError(
                 f"Policy '{policy_id}': type 'regex' requires 'pattern' field"
             )
-        # Validate regex compiles
+        # Validate regex compiles (kept so matching never recompiles it)
         try:
-            re.compile(policy["pattern"])
+            compiled = re.compile(policy["pattern"])
         except re.error as e:
             raise PolicyValidationError(
                 f"Policy '{policy_id}': invalid regex pattern: {e}"
@@ -128,16 +139,57 @@ def _validate_policy(policy: Dict[str, Any], index: int) -> PolicyDict:
             f"Policy '{policy_id}': 'sample_limit' must be a positive integer"
         )
 
-    return {
-        "id": policy["id"],
+    # Validate exact_count (optional, default true)
+    exact_count = policy.get("exact_count", True)
+    if not isinstance(exact_count, bool):
+        raise PolicyValidationError(
+            f"Policy '{policy_id}': 'exact_count' must be a boolean"
+        )
+
+    # Intern the short strings findings are keyed, grouped, and sorted by;
+    # JSON decoding never interns values (dict keys in the engine are literals,
+    # which the compiler already interns)
+    validated: PolicyDict = {
+        "id": sys.intern(policy_id),
         "title": policy["title"],
-        "severity": policy["severity"],
-        "type": policy["type"],
+        "severity": sys.intern(severity),
+        "type": sys.intern(policy_type),
         "pattern": policy.get("pattern"),
         "needle": policy.get("needle"),
         "description": policy["description"],
         "sample_limit": sample_limit,
+        "exact_count": exact_count,
     }
+    if policy_type == "regex":
+        validated["compiled"] = compiled
+    return validated
+
+
+# Runs of this many digits may be integers beyond 64 bits, which orjson
+# would decode as floats
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+
+
+def _decode_json(text: str) -> Any:
+    """
+    Decode a JSON document, with orjson when it is importable.
+
+    orjson is an optional accelerator, not a dependency. Documents it
+    rejects (NaN, lone surrogates, ...) or could decode differently (long
+    digit runs) go to the stdlib decoder, so values and errors always
+    match json.loads.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(text)
+
+    if not _LONG_DIGITS.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 def load_policy_file(path: Union[str, Path]) -> PolicyFileDict:
@@ -157,11 +209,13 @@ def load_policy_file(path: Union[str, Path]) -> PolicyFileDict:
     """
     path = Path(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Policy file not found: {path}")
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Policy file not found: {path}") from None
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with f:
+        data = _decode_json(f.read())
 
     # Validate schema_version
     if "schema_version" not in data:
@@ -212,7 +266,4 @@ def get_severity_rank(severity: str) -> int:
     Returns:
         0 for critical, 1 for high, 2 for medium, 3 for low, 4 for info
     """
-    try:
-        return SEVERITY_LEVELS.index(severity)
-    except ValueError:
-        return 999  # Unknown severity sorts last
+    return _SEVERITY_RANK.get(severity, 999)  # Unknown severity sorts last
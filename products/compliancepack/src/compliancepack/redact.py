@@ -14,11 +14,16 @@ Opt-out: --no-redact flag
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
 # Redaction patterns with their replacement tokens
 # Order matters: more specific patterns first
+# They stay separate patterns applied one after another: in a single
+# alternation the leftmost match of any pattern wins, while here each
+# pattern sees the earlier replacements (a 40-char run in an email
+# address redacts as a key, leaving "ab@[REDACTED_KEY].com")
 REDACTION_PATTERNS = [
     # AWS Access Key pattern
     (re.compile(r"AKIA[0-9A-Z]{16}"), "[REDACTED_KEY]"),
@@ -37,6 +42,42 @@ REDACTION_PATTERNS = [
 ]
 
 
+# A literal every match of the aligned REDACTION_PATTERNS entry contains
+# (None where there is none, e.g. for case-insensitive patterns). A
+# substitution whose literal is absent from the text cannot change it, so
+# it is skipped after an in-check instead of a regex pass. The passes stay
+# sequential: each later pattern sees the earlier replacements.
+REDACTION_TRIGGERS = (
+    "AKIA",
+    None,
+    "-----BEGIN",
+    "-----END",
+    "BEGIN",
+    "END",
+    "@",
+    None,
+    None,
+)
+
+
+# Excerpts repeat when lines do (logs, configs), so redacting a short text
+# is memoized; the size and length bounds keep the cache small
+REDACT_CACHE_MAX_LENGTH = 256
+
+
+def _redact(text: str) -> str:
+    """Apply every redaction pattern, in order."""
+    result = text
+    for (pattern, replacement), trigger in zip(REDACTION_PATTERNS, REDACTION_TRIGGERS):
+        if trigger is None or trigger in result:
+            result = pattern.sub(replacement, result)
+
+    return result
+
+
+_redact_cached = lru_cache(maxsize=8192)(_redact)
+
+
 def redact_text(text: str, apply_redaction: bool = True) -> str:
     """
     Apply redaction to text.
@@ -50,12 +91,9 @@ def redact_text(text: str, apply_redaction: bool = True) -> str:
     """
     if not apply_redaction:
         return text
-
-    result = text
-    for pattern, replacement in REDACTION_PATTERNS:
-        result = pattern.sub(replacement, result)
-
-    return result
+    if len(text) <= REDACT_CACHE_MAX_LENGTH:
+        return _redact_cached(text)
+    return _redact(text)
 
 
 def create_excerpt(
@@ -16,7 +16,8 @@ Mapping from CompliancePack severity to SARIF level:
 - info -> note
 """
 
-from typing import Any, Dict, List, TypedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple, TypedDict
 
 from compliancepack.engine import CheckResultDict, FindingDict, MatchDict
 
@@ -31,6 +32,13 @@ SEVERITY_TO_LEVEL: Dict[str, str] = {
 }
 
 
+# Result ordering by level: error < warning < note (unknown levels last)
+_LEVEL_ORDER: Dict[str, int] = {"error": 0, "warning": 1, "note": 2}
+
+# Location ordering: by file, then line, then column
+_location_key = itemgetter("file", "line", "col_start")
+
+
 class SarifLocation(TypedDict):
     """A SARIF-lite location."""
     file: str
@@ -88,8 +96,9 @@ def _finding_to_result(
     Returns:
         SARIF-lite result dict
     """
-    # Build locations from samples
+    # Build locations from samples, noting redacted excerpts on the way
     locations: List[SarifLocation] = []
+    excerpt_redacted = False
     for sample in finding["samples"]:
         # Multi-file mode: samples have "file" field
         # Single-file mode: use default_input_path
@@ -100,9 +109,11 @@ def _finding_to_result(
             "col_start": sample["col_start"],
             "col_end": sample["col_end"],
         })
+        if not excerpt_redacted and "[REDACTED" in sample.get("excerpt", ""):
+            excerpt_redacted = True
 
     # Sort locations for determinism (by file, then line, then col)
-    locations.sort(key=lambda loc: (loc["file"], loc["line"], loc["col_start"]))
+    locations.sort(key=_location_key)
 
     return {
         "ruleId": finding["id"],
@@ -113,14 +124,21 @@ def _finding_to_result(
             "severity": finding["severity"],
             "description": finding["description"],
             "match_count": finding["match_count"],
-            "excerpt_redacted": any(
-                "[REDACTED" in sample.get("excerpt", "")
-                for sample in finding["samples"]
-            ),
+            "excerpt_redacted": excerpt_redacted,
         },
     }
 
 
+def _result_sort_key(result: SarifResult) -> Tuple[int, str, str, int, int]:
+    """Sort key for results: level, ruleId, then first location."""
+    locations = result["locations"]
+    if locations:
+        file, line, col_start = _location_key(locations[0])
+    else:
+        file, line, col_start = "", 0, 0
+    return (_LEVEL_ORDER.get(result["level"], 3), result["ruleId"], file, line, col_start)
+
+
 def render_sariflite(
     report: CheckResultDict,
     fail_on: str = "high",
@@ -162,19 +180,7 @@ def render_sariflite(
         results.append(_finding_to_result(finding, default_file_path))
 
     # Sort results by (level, ruleId, first location) for determinism
-    def result_sort_key(r: SarifResult) -> tuple:
-        # level ordering: error < warning < note
-        level_order = {"error": 0, "warning": 1, "note": 2}
-        first_loc = r["locations"][0] if r["locations"] else {"file": "", "line": 0, "col_start": 0}
-        return (
-            level_order.get(r["level"], 3),
-            r["ruleId"],
-            first_loc.get("file", ""),
-            first_loc["line"],
-            first_loc["col_start"],
-        )
-
-    results.sort(key=result_sort_key)
+    results.sort(key=_result_sort_key)
 
     return {
         "format": "compliancepack.sariflite.v1",
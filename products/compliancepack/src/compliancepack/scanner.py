@@ -11,12 +11,19 @@ Contract:
 Security boundaries:
 - realpath canonicalization prevents path traversal
 - Symlink targets validated against allowed root (optional)
+- Each canonical directory is entered once (symlink cycles terminate)
 - Max file count caps enumeration
 - Max bytes per file prevents memory exhaustion
 """
 
+import os
+import stat
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import (
+    AbstractSet, BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple,
+    Union,
+)
 
 
 class ScanError(Exception):
@@ -43,7 +50,7 @@ class MaxFilesExceededError(ScanError):
     pass
 
 
-def _normalize_path(path: Path) -> Path:
+def _normalize_path(path: str) -> str:
     """
     Normalize path using realpath canonicalization.
 
@@ -53,49 +60,52 @@ def _normalize_path(path: Path) -> Path:
     Returns:
         Canonicalized absolute path
     """
-    return Path(path).resolve()
+    return str(Path(path).resolve())
 
 
-def _is_within_boundary(target: Path, boundary: Path) -> bool:
+def _boundary_prefix(boundary: str) -> str:
+    """Separator-ended prefix of the paths under a boundary."""
+    return boundary if boundary.endswith(os.sep) else boundary + os.sep
+
+
+def _is_within_boundaries(
+    target: str, boundaries: AbstractSet[str], prefixes: Tuple[str, ...]
+) -> bool:
     """
-    Check if target path is within boundary.
+    Check if target path is within any boundary.
+
+    All paths must be canonical (realpath'ed), so string comparisons decide
+    it: a boundary itself, or a path under a separator-ended prefix (so "/ab"
+    is not within "/a"). The prefixes are built once per scan and tested in
+    one startswith() call.
 
     Args:
         target: Path to check
-        boundary: Boundary root path
+        boundaries: Boundary root paths
+        prefixes: _boundary_prefix() of each boundary
 
     Returns:
-        True if target is within boundary
+        True if target is within a boundary
     """
-    try:
-        target.relative_to(boundary)
-        return True
-    except ValueError:
-        return False
+    return target in boundaries or target.startswith(prefixes)
 
 
-def _matches_extensions(path: Path, extensions: Optional[Set[str]]) -> bool:
-    """
-    Check if path matches allowed extensions.
+def _entry_name(entry: "os.DirEntry[str]") -> str:
+    """Sort key for directory entries."""
+    return entry.name
 
-    Args:
-        path: Path to check
-        extensions: Set of allowed extensions (e.g., {".txt", ".env"})
-                   None means match all files
 
-    Returns:
-        True if path matches or no extension filter
-    """
-    if extensions is None:
-        return True
-    # Handle multi-suffix like .tar.gz - use full suffix
-    suffix = path.suffix.lower()
-    return suffix in extensions
+def _suffix(name: str) -> str:
+    """Lowercase final suffix of a file name, as Path(name).suffix.lower()."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
 
 
 def collect_targets(
-    inputs: List[Path],
-    include_extensions: Optional[Set[str]] = None,
+    inputs: Sequence[Union[str, Path]],
+    include_extensions: Optional[AbstractSet[str]] = None,
     follow_symlinks: bool = False,
     max_files: int = 5000,
 ) -> Tuple[List[Path], List[Tuple[Path, str]]]:
@@ -103,9 +113,11 @@ def collect_targets(
     Collect target files from input paths (files or directories).
 
     Args:
-        inputs: List of input paths (files or directories)
-        include_extensions: Set of allowed extensions (e.g., {".txt", ".env"})
-                           None means scan all files
+        inputs: Input paths as strings or Paths (files or directories)
+        include_extensions: Set of allowed lowercase extensions
+                           (e.g., frozenset({".txt", ".env"})).
+                           None means scan all files: the filter is then
+                           skipped entirely rather than tested per file.
         follow_symlinks: Whether to follow symlinks (default: False)
         max_files: Maximum number of files to collect
 
@@ -122,118 +134,238 @@ def collect_targets(
     if max_files < 1:
         raise ValueError("max_files must be >= 1")
 
-    collected: Set[Path] = set()
-    skipped: List[Tuple[Path, str]] = []
-
-    # Normalize all input roots
-    boundaries: List[Path] = []
-    for input_path in inputs:
-        normalized = _normalize_path(input_path)
-        if not normalized.exists():
-            skipped.append((input_path, "not_found"))
+    # Paths are plain strings throughout the walk; Path objects are built
+    # only for what is returned. Canonical file paths are kept in a dict for
+    # its insertion order: the walk finds files nearly in path order, so the
+    # final sort runs over presorted runs
+    collected: Dict[str, None] = {}
+    skipped: List[Tuple[str, str]] = []
+    # Canonical directories already entered: each is walked once
+    visited_dirs: Set[str] = set()
+
+    # Extension filter resolved once; None means no per-file suffix test
+    extensions: Optional[FrozenSet[str]] = (
+        frozenset(include_extensions) if include_extensions is not None else None
+    )
+
+    # Normalize all input roots (string path functions, one stat per root).
+    # The realpath of each existing root is kept for its traversal below.
+    # Roots keep their Path spelling (str(Path(p)) drops a trailing slash,
+    # which would otherwise make a symlinked root read as its target)
+    roots = [str(Path(input_path)) for input_path in inputs]
+    boundaries: List[str] = []
+    root_realpaths: List[Optional[str]] = []
+    for root in roots:
+        real = os.path.realpath(root)
+        try:
+            st = os.stat(real)
+        except OSError:
+            skipped.append((root, "not_found"))
+            root_realpaths.append(None)
             continue
+        root_realpaths.append(real)
         # Boundary is the parent directory for files, or the directory itself
-        if normalized.is_file():
-            boundaries.append(normalized.parent)
+        if stat.S_ISREG(st.st_mode):
+            boundaries.append(os.path.dirname(real))
         else:
-            boundaries.append(normalized)
-
-    def is_within_any_boundary(path: Path) -> bool:
-        """Check if path is within any allowed boundary."""
-        for boundary in boundaries:
-            if _is_within_boundary(path, boundary):
-                return True
-        return False
-
-    def process_path(path: Path, from_input: Path) -> None:
-        """Process a single path, recursing into directories."""
-        nonlocal collected, skipped
-
+            boundaries.append(real)
+
+    boundary_set = frozenset(boundaries)
+    boundary_prefixes = tuple(_boundary_prefix(boundary) for boundary in boundaries)
+
+    # Directories being walked, innermost last: the remaining sorted entries
+    # of each, and alongside them the canonical directories themselves (a
+    # symlink to one of these is a cycle). Traversal is depth-first in one
+    # loop, so deep trees need no Python recursion.
+    pending: List[Iterator["os.DirEntry[str]"]] = []
+    walk_stack: List[str] = []
+    on_walk_stack: Set[str] = set()
+
+    def process_path(
+        path: str,
+        normalized: Optional[str] = None,
+        is_symlink: Optional[bool] = None,
+    ) -> None:
+        """
+        Process an input or symlink path (directories are queued to walk).
+
+        normalized (the path's realpath) and is_symlink are passed when the
+        caller already knows them, saving the resolve or lstat.
+        """
         # Early exit if we've hit max_files
         if len(collected) >= max_files:
             return
 
-        try:
-            normalized = _normalize_path(path)
-        except (OSError, RuntimeError) as e:
-            skipped.append((path, f"resolve_error:{e}"))
-            return
+        if normalized is None:
+            try:
+                normalized = _normalize_path(path)
+            except (OSError, RuntimeError) as e:
+                skipped.append((path, f"resolve_error:{e}"))
+                return
 
-        # Check for path traversal via ..
-        if not is_within_any_boundary(normalized):
+        # Check for path traversal via .. (for a symlink, normalized is its
+        # resolved target, so this also keeps followed links inside)
+        if not _is_within_boundaries(normalized, boundary_set, boundary_prefixes):
             skipped.append((path, "path_traversal"))
             return
 
         # Handle symlinks
-        if path.is_symlink():
-            if not follow_symlinks:
-                skipped.append((path, "symlink_skipped"))
-                return
-            # Symlink following enabled - verify target is within boundary
-            try:
-                target = path.resolve()
-                if not is_within_any_boundary(target):
-                    skipped.append((path, "symlink_escape"))
-                    return
-            except (OSError, RuntimeError):
-                skipped.append((path, "symlink_broken"))
-                return
+        if is_symlink is None:
+            is_symlink = os.path.islink(path)
+        if is_symlink and not follow_symlinks:
+            skipped.append((path, "symlink_skipped"))
+            return
+
+        # One stat answers both "file?" and "directory?" (is_file() followed
+        # by is_dir() would stat again); a failed stat counts as neither
+        try:
+            mode = os.stat(normalized).st_mode
+        except OSError:
+            mode = 0
 
-        if normalized.is_file():
-            # Check extension filter
-            if not _matches_extensions(normalized, include_extensions):
+        if stat.S_ISREG(mode):
+            # Check extension filter (single suffix: .tar.gz matches ".gz")
+            if extensions is not None and _suffix(os.path.basename(normalized)) not in extensions:
                 skipped.append((path, "extension_filtered"))
                 return
-            collected.add(normalized)
-        elif normalized.is_dir():
-            # Recurse into directory
-            try:
-                children = list(normalized.iterdir())
-            except PermissionError:
-                skipped.append((path, "permission_denied"))
-                return
-            except OSError as e:
-                skipped.append((path, f"read_error:{e}"))
-                return
-
-            # Sort children for deterministic traversal
-            children.sort(key=lambda p: p.name)
-            for child in children:
-                if len(collected) >= max_files:
-                    break
-                process_path(child, from_input)
+            collected[normalized] = None
+        elif stat.S_ISDIR(mode):
+            enter_directory(normalized, path, is_symlink)
         else:
             # Special file (socket, device, etc.)
             skipped.append((path, "special_file"))
 
+    def enter_directory(
+        directory: str, path: Optional[str], is_symlink: bool
+    ) -> None:
+        """
+        List a canonical directory onto pending.
+
+        path is how the directory was reached, for skip reports (None: the
+        directory itself).
+        """
+        # Enter each canonical directory once. Only a symlink to a directory
+        # still being walked (itself or an ancestor) is a cycle; another
+        # route to a directory already walked is a silent duplicate
+        if directory in visited_dirs:
+            if is_symlink and directory in on_walk_stack:
+                skipped.append((path or directory, "symlink_loop"))
+            return
+        visited_dirs.add(directory)
+
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            skipped.append((path or directory, "permission_denied"))
+            return
+        except OSError as e:
+            skipped.append((path or directory, f"read_error:{e}"))
+            return
+
+        # Sort children for deterministic traversal
+        entries.sort(key=_entry_name)
+        pending.append(iter(entries))
+        walk_stack.append(directory)
+        on_walk_stack.add(directory)
+
+    def walk_pending() -> None:
+        """Visit the entries of pending directories, depth-first."""
+        while pending:
+            entries = pending[-1]
+            for entry in entries:
+                if len(collected) >= max_files:
+                    pending.clear()
+                    walk_stack.clear()
+                    on_walk_stack.clear()
+                    return
+
+                # The entry's path is the canonical directory joined with its name
+                child = entry.path
+                if entry.is_symlink():
+                    # Symlinks get the full resolve and boundary checks
+                    process_path(child, is_symlink=True)
+                    if pending[-1] is not entries:
+                        break  # Walk the linked directory first
+                    continue
+
+                # A plain entry of a canonical directory inside the boundary
+                # is itself canonical and inside it, so no resolve or boundary
+                # test is needed, and the listing already typed it (no stat)
+                try:
+                    is_file = entry.is_file(follow_symlinks=False)
+                    is_dir = not is_file and entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_file = is_dir = False
+
+                if is_file:
+                    if extensions is not None and _suffix(entry.name) not in extensions:
+                        skipped.append((child, "extension_filtered"))
+                        continue
+                    collected[child] = None
+                elif is_dir:
+                    enter_directory(child, None, False)
+                    if pending[-1] is not entries:
+                        break  # Walk the subdirectory first
+                else:
+                    skipped.append((child, "special_file"))
+            else:
+                # Every entry visited (the iterator resumes after a break)
+                pending.pop()
+                on_walk_stack.discard(walk_stack.pop())
+
     # Track if we hit the limit (for reporting)
     hit_max_files = False
 
     # Process each input
-    for input_path in inputs:
-        path = Path(input_path)
-        process_path(path, path)
+    for root, real in zip(roots, root_realpaths):
+        process_path(root, real)
+        walk_pending()
         if len(collected) >= max_files:
             hit_max_files = True
 
     # Sort collected files for deterministic output
-    sorted_files = sorted(collected, key=lambda p: str(p))
+    sorted_paths = sorted(collected)
 
     # Truncate if over max (deterministic - already sorted)
-    if len(sorted_files) > max_files:
-        sorted_files = sorted_files[:max_files]
+    if len(sorted_paths) > max_files:
+        sorted_paths = sorted_paths[:max_files]
         hit_max_files = True
+    sorted_files = [Path(p) for p in sorted_paths]
 
     # Add truncation notice if we hit the limit
     if hit_max_files and len(sorted_files) == max_files:
-        skipped.append((Path("<truncated>"), f"max_files_exceeded:{len(collected)}"))
+        skipped.append(("<truncated>", f"max_files_exceeded:{len(collected)}"))
+
+    return sorted_files, [(Path(p), reason) for p, reason in skipped]
 
-    return sorted_files, skipped
+
+def _read_up_to(f: BinaryIO, size: int) -> bytes:
+    """
+    Read size bytes from an unbuffered file, or up to EOF.
+
+    One read() may return fewer bytes than asked without being at EOF
+    (procfs, FUSE, NFS, or reads over the ~2 GiB per-call cap on Linux),
+    so short reads are continued until size bytes or an empty read.
+    """
+    raw = f.read(size)
+    if len(raw) >= size or not raw:
+        return raw
+    chunks = [raw]
+    remaining = size - len(raw)
+    while remaining > 0:
+        chunk = f.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
 
 
 def read_file_limited(
     path: Path,
     max_bytes: int = 1_000_000,
+    file_size: Optional[int] = None,
 ) -> Tuple[str, bool]:
     """
     Read file content with byte limit and safe decode.
@@ -241,6 +373,9 @@ def read_file_limited(
     Args:
         path: Path to file
         max_bytes: Maximum bytes to read
+        file_size: Size from a stat the caller already made; if omitted,
+                   the opened file is fstat'ed (no second path lookup).
+                   Reading stops at this size, even if the file has grown
 
     Returns:
         Tuple of (content, was_truncated)
@@ -252,19 +387,30 @@ def read_file_limited(
         raise ValueError("max_bytes must be >= 1")
 
     try:
-        file_size = path.stat().st_size
-        truncated = file_size > max_bytes
-
-        with open(path, "rb") as f:
-            raw = f.read(max_bytes)
-
-        # Try UTF-8 first, then fallback to latin-1 (always succeeds)
-        try:
-            content = raw.decode("utf-8")
-        except UnicodeDecodeError:
-            content = raw.decode("latin-1")
-
-        return content, truncated
+        # Unbuffered: a sized read is one read() straight into its result,
+        # without a 1 MB read buffer per file. The fstat that sizes it is
+        # cheaper than skipping it with a read(max_bytes + 1), which would
+        # allocate a max_bytes result for every small file.
+        with open(path, "rb", buffering=0) as f:
+            if file_size is None:
+                file_size = os.fstat(f.fileno()).st_size
+            truncated = file_size > max_bytes
+            read_size = min(file_size, max_bytes)
+
+            # A read, not a memory map: a file truncated while it is read
+            # (log rotation with copytruncate) just yields fewer bytes,
+            # where touching a mapped page past the new end raises SIGBUS.
+            if read_size:
+                raw = _read_up_to(f, read_size)
+            else:
+                # A zero st_size may be unreliable (e.g. procfs), so read to
+                # the limit, one byte past it to tell whether it was cut
+                raw = _read_up_to(f, max_bytes + 1)
+                truncated = len(raw) > max_bytes
+                if truncated:
+                    raw = raw[:max_bytes]
+
+        return _decode(raw), truncated
 
     except PermissionError:
         raise ScanError(f"Permission denied: {path}")
@@ -274,6 +420,20 @@ def read_file_limited(
         raise ScanError(f"Read error: {path}: {e}")
 
 
+def _decode(raw) -> str:
+    """Decode UTF-8, falling back to latin-1 (which always succeeds)."""
+    # No isascii() pre-check: the UTF-8 decoder already copies ASCII runs a
+    # word at a time, so a separate scan only adds a pass over the data
+    try:
+        return str(raw, "utf-8")
+    except UnicodeDecodeError:
+        return str(raw, "latin-1")
+
+
+# Skip reasons carrying a ":<detail>" suffix, summarized without it
+_DYNAMIC_REASONS = ("resolve_error:", "read_error:", "max_files_exceeded:")
+
+
 def summarize_skipped(skipped: List[Tuple[Path, str]]) -> dict:
     """
     Summarize skipped files by reason.
@@ -284,16 +444,12 @@ def summarize_skipped(skipped: List[Tuple[Path, str]]) -> dict:
     Returns:
         Dict mapping reason -> count (stable key order)
     """
-    counts: dict = {}
-    for _, reason in skipped:
-        # Normalize reasons with dynamic parts
-        if reason.startswith("resolve_error:"):
-            reason = "resolve_error"
-        elif reason.startswith("read_error:"):
-            reason = "read_error"
-        elif reason.startswith("max_files_exceeded:"):
-            reason = "max_files_exceeded"
-        counts[reason] = counts.get(reason, 0) + 1
+    # Normalize reasons with dynamic parts ("read_error:<detail>" counts
+    # as "read_error")
+    counts = Counter(
+        reason.partition(":")[0] if reason.startswith(_DYNAMIC_REASONS) else reason
+        for _, reason in skipped
+    )
 
     # Sort by key for determinism
     return dict(sorted(counts.items()))
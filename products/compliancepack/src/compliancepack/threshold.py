@@ -79,13 +79,59 @@ def count_violations(
     Returns:
         Tuple of (violation_count, list of violating finding IDs)
     """
-    violations: List[str] = []
-    for finding in findings:
-        if severity_meets_threshold(finding["severity"], threshold_severity):
-            violations.append(finding["id"])
+    if not findings:
+        return 0, []
+
+    # Threshold validated and ranked once; each finding is then one set
+    # membership test (unknown severities rank last and never violate)
+    threshold_rank = get_threshold_rank(threshold_severity)
+    violating = frozenset(
+        severity for severity in SEVERITY_LEVELS
+        if get_severity_rank(severity) <= threshold_rank
+    )
+    violations = [
+        finding["id"] for finding in findings if finding["severity"] in violating
+    ]
     return len(violations), violations
 
 
+def count_and_truncate(
+    findings: List[dict],
+    threshold_severity: str,
+    max_findings: int = 0,
+) -> Tuple[int, int, bool]:
+    """
+    Count threshold violations and compute the --max-findings cut in one step.
+
+    Findings must be sorted by severity rank (most severe first), as both
+    engine entry points guarantee. Violations then form a prefix, so the
+    count is a binary search for the first finding below threshold:
+    O(log N) rank lookups instead of a pass over every finding.
+
+    Args:
+        findings: Severity-sorted finding dicts (must have 'severity' key)
+        threshold_severity: Threshold severity level
+        max_findings: Output limit (0 = unlimited)
+
+    Returns:
+        Tuple of (violation_count, findings_limit, truncated) where
+        findings_limit is the number of leading findings to output
+    """
+    threshold_rank = get_threshold_rank(threshold_severity)
+
+    lo, hi = 0, len(findings)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if get_severity_rank(findings[mid]["severity"]) <= threshold_rank:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    if max_findings > 0 and len(findings) > max_findings:
+        return lo, max_findings, True
+    return lo, len(findings), False
+
+
 def determine_exit_code(
     violation_count: int,
     exit_zero_override: bool = False,
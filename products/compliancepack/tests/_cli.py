@@ -0,0 +1,54 @@
+"""
+CLI runners shared by the CompliancePack test modules.
+
+run_cli calls compliancepack.cli.main() in-process, so a test does not
+pay for an interpreter start. COMPLIANCEPACK_TEST_SUBPROCESS=1 routes it
+through the real `python -m compliancepack` entry point instead.
+"""
+
+import io
+import os
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from compliancepack.cli import main
+
+PRODUCT_ROOT = Path(__file__).parent.parent
+
+RUN_SUBPROCESS = os.environ.get("COMPLIANCEPACK_TEST_SUBPROCESS") == "1"
+
+# Environment for the module entry point, built once
+SUBPROCESS_ENV = {**os.environ, "PYTHONPATH": str(PRODUCT_ROOT / "src")}
+
+
+def run_cli_subprocess(*args: str, cwd: Path = None) -> subprocess.CompletedProcess:
+    """Run the CompliancePack CLI as `python -m compliancepack`."""
+    cmd = [sys.executable, "-m", "compliancepack", *args]
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        cwd=cwd or PRODUCT_ROOT,
+        env=SUBPROCESS_ENV,
+    )
+
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    """Run the CompliancePack CLI in-process with given arguments."""
+    if RUN_SUBPROCESS:
+        return run_cli_subprocess(*args)
+    # A text stream over bytes: the report is written to stdout.buffer
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            main(list(args))
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code or 0
+    stdout.flush()
+    return subprocess.CompletedProcess(
+        list(args), returncode, stdout.buffer.getvalue().decode("utf-8"), stderr.getvalue()
+    )
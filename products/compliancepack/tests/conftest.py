@@ -0,0 +1,36 @@
+"""
+Pytest configuration and shared fixtures for CompliancePack tests.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from _cli import run_cli
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXED_TIME = "2025-01-01T00:00:00Z"
+
+
+@pytest.fixture(scope="session")
+def default_check_result() -> subprocess.CompletedProcess:
+    """
+    One `check` run on the sample input and v1 policy with --fixed-time.
+
+    Tests that only inspect this output share the run; tests that need a
+    second run (determinism) or other flags invoke the CLI themselves.
+    """
+    return run_cli(
+        "check",
+        "--input", str(FIXTURES_DIR / "sample_input.txt"),
+        "--policy", str(FIXTURES_DIR / "policy_v1.json"),
+        "--fixed-time", FIXED_TIME,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_check_json(default_check_result: subprocess.CompletedProcess) -> dict:
+    """The parsed report of default_check_result."""
+    return json.loads(default_check_result.stdout)
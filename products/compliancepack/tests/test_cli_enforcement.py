@@ -10,35 +10,27 @@ Contract-grade tests for:
 - Byte-for-byte determinism
 """
 
+import hashlib
 import json
 import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
+from _cli import run_cli, run_cli_subprocess
 
-def run_cli(*args: str, cwd: Path = None) -> subprocess.CompletedProcess:
-    """Run the CompliancePack CLI with given arguments."""
-    cmd = [sys.executable, "-m", "compliancepack", *args]
-    env = {"PYTHONPATH": str(Path(__file__).parent.parent / "src")}
-    return subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=cwd or Path(__file__).parent.parent,
-        env={**dict(__import__("os").environ), **env},
-    )
+
+@pytest.fixture(scope="module")
+def input_file() -> Path:
+    """The shared sample input (secrets with critical and high findings)."""
+    return Path(__file__).parent / "fixtures" / "sample_input.txt"
 
 
 class TestExitCodeSemantics:
     """Test exit code behavior."""
 
-    def test_exit_zero_no_violations(self):
+    def test_exit_zero_no_violations(self, input_file: Path):
         """Exit 0 when no findings at/above threshold."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         # secrets.v1 has critical/high findings, set threshold to critical only
         # and we should still get exit 3 because there IS a critical finding
         result = run_cli(
@@ -51,11 +43,8 @@ class TestExitCodeSemantics:
         # Should be exit 3 (has findings at/above info level)
         assert result.returncode == 3
 
-    def test_exit_three_with_violations(self):
+    def test_exit_three_with_violations(self, input_file: Path):
         """Exit 3 when findings at/above threshold exist."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -67,11 +56,8 @@ class TestExitCodeSemantics:
         output = json.loads(result.stdout)
         assert output["threshold"]["violations"] > 0
 
-    def test_exit_two_usage_error(self):
+    def test_exit_two_usage_error(self, input_file: Path):
         """Exit 2 for CLI usage/config errors."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         # Missing --pack or --policy
         result = run_cli(
             "check",
@@ -79,11 +65,8 @@ class TestExitCodeSemantics:
         )
         assert result.returncode == 2
 
-    def test_exit_two_invalid_fail_on(self):
+    def test_exit_two_invalid_fail_on(self, input_file: Path):
         """Exit 2 for invalid --fail-on value."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -96,11 +79,8 @@ class TestExitCodeSemantics:
 class TestFailOnThreshold:
     """Test --fail-on threshold behavior."""
 
-    def test_fail_on_critical_only(self):
+    def test_fail_on_critical_only(self, input_file: Path):
         """--fail-on critical only catches critical findings."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -113,11 +93,8 @@ class TestFailOnThreshold:
         assert output["threshold"]["fail_on"] == "critical"
         assert output["threshold"]["violations"] == 1  # Only critical
 
-    def test_fail_on_high_catches_high_and_critical(self):
+    def test_fail_on_high_catches_high_and_critical(self, input_file: Path):
         """--fail-on high catches high and critical findings."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -129,11 +106,8 @@ class TestFailOnThreshold:
         output = json.loads(result.stdout)
         assert output["threshold"]["violations"] == 2  # critical + high
 
-    def test_fail_on_default_is_high(self):
+    def test_fail_on_default_is_high(self, input_file: Path):
         """Default --fail-on is high."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -147,11 +121,8 @@ class TestFailOnThreshold:
 class TestOutputFormat:
     """Test --format output selection."""
 
-    def test_default_format_is_check_v1(self):
+    def test_default_format_is_check_v1(self, input_file: Path):
         """Default format is compliancepack.check.v1."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -162,11 +133,8 @@ class TestOutputFormat:
         output = json.loads(result.stdout)
         assert output["format"] == "compliancepack.check.v1"
 
-    def test_sariflite_format(self):
+    def test_sariflite_format(self, input_file: Path):
         """--format sariflite produces correct format."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -181,11 +149,8 @@ class TestOutputFormat:
         assert "tool" in output
         assert "runs" in output
 
-    def test_invalid_format_exit_two(self):
+    def test_invalid_format_exit_two(self, input_file: Path):
         """Invalid --format value produces exit 2."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -198,11 +163,8 @@ class TestOutputFormat:
 class TestMaxFindings:
     """Test --max-findings truncation."""
 
-    def test_max_findings_truncates(self):
+    def test_max_findings_truncates(self, input_file: Path):
         """--max-findings limits output findings."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -214,11 +176,8 @@ class TestMaxFindings:
         assert len(output["findings"]) == 1
         assert output["truncated"] is True
 
-    def test_max_findings_zero_unlimited(self):
+    def test_max_findings_zero_unlimited(self, input_file: Path):
         """--max-findings 0 means unlimited."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -230,11 +189,8 @@ class TestMaxFindings:
         assert output["truncated"] is False
         assert output["max_findings"] is None
 
-    def test_max_findings_not_truncated_if_under(self):
+    def test_max_findings_not_truncated_if_under(self, input_file: Path):
         """Not truncated if findings count under limit."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -249,11 +205,8 @@ class TestMaxFindings:
 class TestExitZeroOverride:
     """Test --exit-zero override."""
 
-    def test_exit_zero_forces_zero(self):
+    def test_exit_zero_forces_zero(self, input_file: Path):
         """--exit-zero forces exit 0 even with violations."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -268,11 +221,8 @@ class TestExitZeroOverride:
         assert output["threshold"]["violations"] > 0
         assert output["exit_code_expected"] == 0
 
-    def test_exit_zero_with_no_violations(self):
+    def test_exit_zero_with_no_violations(self, input_file: Path):
         """--exit-zero with no violations still exits 0."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         # Use a threshold that won't catch the findings
         # The sample has critical and high, so info will catch them
         # We need a case with no findings - use pii.v1 with critical threshold
@@ -287,14 +237,42 @@ class TestExitZeroOverride:
         assert result.returncode == 0
 
 
+# SHA-256 digests of expected report bytes: any output change, however
+# small, fails these tests until the digest is deliberately re-recorded
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+
+def stdout_digest(result: subprocess.CompletedProcess, input_file: Path) -> str:
+    """SHA-256 of a run's stdout, with the machine-specific input path masked."""
+    masked = result.stdout.replace(json.dumps(str(input_file))[1:-1], "<input>")
+    return hashlib.sha256(masked.encode("utf-8")).hexdigest()
+
+
+def read_golden(name: str) -> str:
+    """Recorded stdout digest for a determinism test."""
+    return (GOLDEN_DIR / f"{name}.sha256").read_text().strip()
+
+
 class TestDeterminism:
-    """Test byte-for-byte determinism."""
+    """Test byte-for-byte determinism against recorded output digests."""
 
-    def test_check_v1_deterministic(self):
+    def test_check_v1_deterministic(self, input_file: Path):
         """check.v1 format is byte-for-byte deterministic."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
+        args = [
+            "check",
+            "--input", str(input_file),
+            "--pack", "secrets.v1",
+            "--fail-on", "high",
+            "--fixed-time", "2025-01-01T00:00:00Z",
+        ]
 
+        result = run_cli(*args)
+
+        assert result.returncode == 3
+        assert stdout_digest(result, input_file) == read_golden("check_v1")
+
+    def test_module_entry_point_matches_in_process(self, input_file: Path):
+        """`python -m compliancepack` emits the same bytes and exit code."""
         args = [
             "check",
             "--input", str(input_file),
@@ -303,17 +281,14 @@ class TestDeterminism:
             "--fixed-time", "2025-01-01T00:00:00Z",
         ]
 
-        result1 = run_cli(*args)
-        result2 = run_cli(*args)
+        in_process = run_cli(*args)
+        spawned = run_cli_subprocess(*args)
 
-        assert result1.returncode == result2.returncode
-        assert result1.stdout == result2.stdout
+        assert spawned.returncode == in_process.returncode == 3
+        assert spawned.stdout == in_process.stdout
 
-    def test_sariflite_deterministic(self):
+    def test_sariflite_deterministic(self, input_file: Path):
         """sariflite format is byte-for-byte deterministic."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         args = [
             "check",
             "--input", str(input_file),
@@ -323,17 +298,13 @@ class TestDeterminism:
             "--fixed-time", "2025-01-01T00:00:00Z",
         ]
 
-        result1 = run_cli(*args)
-        result2 = run_cli(*args)
+        result = run_cli(*args)
 
-        assert result1.returncode == result2.returncode
-        assert result1.stdout == result2.stdout
+        assert result.returncode == 3
+        assert stdout_digest(result, input_file) == read_golden("sariflite")
 
-    def test_max_findings_deterministic(self):
+    def test_max_findings_deterministic(self, input_file: Path):
         """Truncation with --max-findings is deterministic."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         args = [
             "check",
             "--input", str(input_file),
@@ -342,20 +313,16 @@ class TestDeterminism:
             "--fixed-time", "2025-01-01T00:00:00Z",
         ]
 
-        result1 = run_cli(*args)
-        result2 = run_cli(*args)
+        result = run_cli(*args)
 
-        assert result1.stdout == result2.stdout
+        assert stdout_digest(result, input_file) == read_golden("max_findings")
 
 
 class TestOutputSchemaExtensions:
     """Test output schema has new fields."""
 
-    def test_check_v1_has_threshold(self):
+    def test_check_v1_has_threshold(self, input_file: Path):
         """check.v1 format includes threshold field."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -367,11 +334,8 @@ class TestOutputSchemaExtensions:
         assert "fail_on" in output["threshold"]
         assert "violations" in output["threshold"]
 
-    def test_check_v1_has_exit_code_expected(self):
+    def test_check_v1_has_exit_code_expected(self, input_file: Path):
         """check.v1 format includes exit_code_expected."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -381,11 +345,8 @@ class TestOutputSchemaExtensions:
         output = json.loads(result.stdout)
         assert "exit_code_expected" in output
 
-    def test_check_v1_has_truncated(self):
+    def test_check_v1_has_truncated(self, input_file: Path):
         """check.v1 format includes truncated field."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-
         result = run_cli(
             "check",
             "--input", str(input_file),
@@ -10,8 +10,9 @@ These are hard security constraints enforced by CI.
 """
 
 import ast
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import pytest
 
@@ -21,7 +22,7 @@ SRC_DIR = Path(__file__).parent.parent / "src" / "compliancepack"
 
 
 # Forbidden networking modules
-FORBIDDEN_NETWORK_MODULES: Set[str] = {
+FORBIDDEN_NETWORK_MODULES: FrozenSet[str] = frozenset({
     "socket", "socketserver",
     "ssl",
     "http", "http.client", "http.server",
@@ -30,47 +31,136 @@ FORBIDDEN_NETWORK_MODULES: Set[str] = {
     "aiohttp", "httpx", "requests", "urllib3",
     "websocket", "websockets",
     "paramiko", "fabric",
-}
+})
 
 # Forbidden shell execution modules
-FORBIDDEN_SHELL_MODULES: Set[str] = {
+FORBIDDEN_SHELL_MODULES: FrozenSet[str] = frozenset({
     "subprocess",
     "pty",
-}
+})
 
 # Forbidden file write methods
-FORBIDDEN_WRITE_METHODS: Set[str] = {
+FORBIDDEN_WRITE_METHODS: FrozenSet[str] = frozenset({
     "write_text", "write_bytes", "mkdir", "makedirs",
     "unlink", "remove", "rmdir", "rename", "replace",
     "touch", "symlink_to", "hardlink_to",
-}
+})
 
 
-def scan_imports_ast(filepath: Path) -> List[Tuple[str, int, str]]:
-    """Scan a Python file for imports using AST."""
+def parse_source(filepath: Path) -> Optional[ast.Module]:
+    """Parse a Python file, or return None if it cannot be parsed."""
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             source = f.read()
-        tree = ast.parse(source, filename=str(filepath))
+        return ast.parse(source, filename=str(filepath))
     except (SyntaxError, UnicodeDecodeError):
-        return []
+        return None
+
+
+def module_prefixes(module: str) -> List[str]:
+    """A dotted module name's packages, shortest first, ending with itself."""
+    prefixes = []
+    end = module.find(".")
+    while end > 0:
+        prefixes.append(module[:end])
+        end = module.find(".", end + 1)
+    prefixes.append(module)
+    return prefixes
+
+
+def imported_modules(node: ast.AST) -> List[Tuple[List[str], str]]:
+    """
+    (prefixes, statement) for each module an import node brings in.
+
+    The prefixes list the parent packages before the module (urllib.request
+    yields urllib, urllib.request), so a check is a set lookup per prefix
+    and stops at the first forbidden one.
+    """
+    imports: List[Tuple[List[str], str]] = []
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            imports.append((module_prefixes(alias.name), f"import {alias.name}"))
+    elif isinstance(node, ast.ImportFrom):
+        if node.module:
+            imports.append(
+                (module_prefixes(node.module), f"from {node.module} import ...")
+            )
+    return imports
+
+
+def first_forbidden(prefixes: List[str], forbidden: FrozenSet[str]) -> Optional[str]:
+    """The first of prefixes in forbidden, if any."""
+    for module in prefixes:
+        if module in forbidden:
+            return module
+    return None
+
+
+def open_mode(node: ast.Call) -> Optional[str]:
+    """The literal mode of an open() call, if given."""
+    mode = None
+    if len(node.args) >= 2:
+        mode_arg = node.args[1]
+        if isinstance(mode_arg, ast.Constant):
+            mode = mode_arg.value
+    for kw in node.keywords:
+        if kw.arg == "mode" and isinstance(kw.value, ast.Constant):
+            mode = kw.value.value
+    return mode
+
+
+@dataclass
+class Violations:
+    """Contract violations found in one source file, by check."""
+
+    network: List[str] = field(default_factory=list)
+    shell: List[str] = field(default_factory=list)
+    syscall: List[str] = field(default_factory=list)
+    open_write: List[str] = field(default_factory=list)
+    pathlib_write: List[str] = field(default_factory=list)
 
-    imports: List[Tuple[str, int, str]] = []
+
+def collect_violations(path: Path, tree: ast.Module) -> Violations:
+    """Run every contract check over a parsed module in one AST walk."""
+    found = Violations()
 
     for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append((alias.name, node.lineno, f"import {alias.name}"))
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.append((node.module, node.lineno, f"from {node.module} import ..."))
-                parts = node.module.split(".")
-                for i in range(len(parts)):
-                    parent = ".".join(parts[: i + 1])
-                    if parent != node.module:
-                        imports.append((parent, node.lineno, f"from {node.module} import ..."))
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            # One report per import statement and check
+            for prefixes, stmt in imported_modules(node):
+                module = first_forbidden(prefixes, FORBIDDEN_NETWORK_MODULES)
+                if module is not None:
+                    found.network.append(
+                        f"{path.name}:{node.lineno}: {stmt} (forbidden: {module})"
+                    )
+                module = first_forbidden(prefixes, FORBIDDEN_SHELL_MODULES)
+                if module is not None:
+                    found.shell.append(
+                        f"{path.name}:{node.lineno}: {stmt} (forbidden: {module})"
+                    )
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Attribute):
+                if (
+                    isinstance(func.value, ast.Name)
+                    and func.value.id == "os"
+                    and func.attr in ("system", "popen")
+                ):
+                    found.syscall.append(
+                        f"{path.name}:{node.lineno}: os.{func.attr}() is forbidden"
+                    )
+                if func.attr in FORBIDDEN_WRITE_METHODS:
+                    found.pathlib_write.append(
+                        f"{path.name}:{node.lineno}: {func.attr}() is forbidden"
+                    )
+            elif isinstance(func, ast.Name) and func.id == "open":
+                mode = open_mode(node)
+                if mode and any(c in mode for c in "wax"):
+                    found.open_write.append(
+                        f"{path.name}:{node.lineno}: open() with write mode '{mode}'"
+                    )
 
-    return imports
+    return found
 
 
 def get_source_files() -> List[Path]:
@@ -78,24 +168,71 @@ def get_source_files() -> List[Path]:
     return list(SRC_DIR.rglob("*.py"))
 
 
+@pytest.fixture(scope="session")
+def parsed_sources() -> List[Tuple[Path, ast.Module]]:
+    """Every source file parsed once, shared by all the checks below."""
+    parsed = []
+    for py_file in get_source_files():
+        tree = parse_source(py_file)
+        if tree is not None:
+            parsed.append((py_file, tree))
+    return parsed
+
+
+@pytest.fixture(scope="session")
+def all_violations(parsed_sources) -> Dict[Path, Violations]:
+    """Violations of every check, per source file, from one walk per file."""
+    return {py_file: collect_violations(py_file, tree) for py_file, tree in parsed_sources}
+
+
+def violations_of(all_violations: Dict[Path, Violations], check: str) -> List[str]:
+    """One check's violations across all source files."""
+    return [v for found in all_violations.values() for v in getattr(found, check)]
+
+
+class TestSourceParsing:
+    """Verify the checks below see every source file."""
+
+    def test_every_source_file_parsed_once(self, parsed_sources):
+        """Every source file parses and is listed exactly once."""
+        files = [py_file for py_file, _ in parsed_sources]
+        assert sorted(files) == sorted(get_source_files())
+        assert len(set(files)) == len(files)
+
+
+class TestViolationCollection:
+    """Verify the fused walk reports each kind of violation."""
+
+    def test_each_check_detects_its_violation(self):
+        """A module breaking every contract is reported once per check."""
+        source = "\n".join([
+            "import os",
+            "import urllib.request",
+            "from subprocess import run",
+            "os.system('ls')",
+            "open('out.txt', 'w')",
+            "open('in.txt', mode='rb')",
+            "Path('x').write_text('y')",
+        ])
+        found = collect_violations(Path("bad.py"), ast.parse(source))
+
+        assert found.network == [
+            "bad.py:2: import urllib.request (forbidden: urllib)",
+        ]
+        assert found.shell == [
+            "bad.py:3: from subprocess import ... (forbidden: subprocess)",
+        ]
+        assert found.syscall == ["bad.py:4: os.system() is forbidden"]
+        assert found.open_write == ["bad.py:5: open() with write mode 'w'"]
+        assert found.pathlib_write == ["bad.py:7: write_text() is forbidden"]
+
+
 class TestNoNetworkingImports:
     """Verify no networking imports in source code."""
 
-    def test_no_forbidden_network_imports(self):
+    def test_no_forbidden_network_imports(self, all_violations):
         """Source files must not import networking modules."""
-        violations = []
-
-        for py_file in get_source_files():
-            imports = scan_imports_ast(py_file)
-            for module, lineno, stmt in imports:
-                module_parts = module.split(".")
-                for i in range(len(module_parts)):
-                    check_module = ".".join(module_parts[: i + 1])
-                    if check_module in FORBIDDEN_NETWORK_MODULES:
-                        violations.append(
-                            f"{py_file.name}:{lineno}: {stmt} (forbidden: {check_module})"
-                        )
-                        break
+        violations = violations_of(all_violations, "network")
 
         assert not violations, (
             "Networking imports found:\n" + "\n".join(f"  - {v}" for v in violations)
@@ -105,43 +242,17 @@ class TestNoNetworkingImports:
 class TestNoShellExecution:
     """Verify no shell execution in source code."""
 
-    def test_no_forbidden_shell_imports(self):
+    def test_no_forbidden_shell_imports(self, all_violations):
         """Source files must not import shell execution modules."""
-        violations = []
-
-        for py_file in get_source_files():
-            imports = scan_imports_ast(py_file)
-            for module, lineno, stmt in imports:
-                if module in FORBIDDEN_SHELL_MODULES:
-                    violations.append(
-                        f"{py_file.name}:{lineno}: {stmt} (forbidden: {module})"
-                    )
+        violations = violations_of(all_violations, "shell")
 
         assert not violations, (
             "Shell execution imports found:\n" + "\n".join(f"  - {v}" for v in violations)
         )
 
-    def test_no_os_system_calls(self):
+    def test_no_os_system_calls(self, all_violations):
         """Source files must not call os.system() or os.popen()."""
-        violations = []
-
-        for py_file in get_source_files():
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    source = f.read()
-                tree = ast.parse(source, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Attribute):
-                        func_name = node.func.attr
-                        if isinstance(node.func.value, ast.Name):
-                            if node.func.value.id == "os" and func_name in ("system", "popen"):
-                                violations.append(
-                                    f"{py_file.name}:{node.lineno}: os.{func_name}() is forbidden"
-                                )
+        violations = violations_of(all_violations, "syscall")
 
         assert not violations, (
             "os.system/popen calls found:\n" + "\n".join(f"  - {v}" for v in violations)
@@ -151,57 +262,17 @@ class TestNoShellExecution:
 class TestNoFileWrites:
     """Verify no file write operations in source code."""
 
-    def test_no_open_write_mode(self):
+    def test_no_open_write_mode(self, all_violations):
         """Source files must not use open() with write modes."""
-        violations = []
-
-        for py_file in get_source_files():
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    source = f.read()
-                tree = ast.parse(source, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id == "open":
-                        mode = None
-                        if len(node.args) >= 2:
-                            mode_arg = node.args[1]
-                            if isinstance(mode_arg, ast.Constant):
-                                mode = mode_arg.value
-                        for kw in node.keywords:
-                            if kw.arg == "mode" and isinstance(kw.value, ast.Constant):
-                                mode = kw.value.value
-                        if mode and any(c in mode for c in "wax"):
-                            violations.append(
-                                f"{py_file.name}:{node.lineno}: open() with write mode '{mode}'"
-                            )
+        violations = violations_of(all_violations, "open_write")
 
         assert not violations, (
             "File write operations found:\n" + "\n".join(f"  - {v}" for v in violations)
         )
 
-    def test_no_pathlib_write_methods(self):
+    def test_no_pathlib_write_methods(self, all_violations):
         """Source files must not use pathlib write methods."""
-        violations = []
-
-        for py_file in get_source_files():
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    source = f.read()
-                tree = ast.parse(source, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Attribute):
-                        if node.func.attr in FORBIDDEN_WRITE_METHODS:
-                            violations.append(
-                                f"{py_file.name}:{node.lineno}: {node.func.attr}() is forbidden"
-                            )
+        violations = violations_of(all_violations, "pathlib_write")
 
         assert not violations, (
             "Pathlib write methods found:\n" + "\n".join(f"  - {v}" for v in violations)
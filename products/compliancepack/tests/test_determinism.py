@@ -4,42 +4,28 @@ CompliancePack Determinism Tests.
 Validates byte-for-byte identical output with --fixed-time.
 """
 
+import io
 import json
-import subprocess
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-
-def run_cli(*args: str, cwd: Path = None) -> subprocess.CompletedProcess:
-    """Run the CompliancePack CLI with given arguments."""
-    cmd = [sys.executable, "-m", "compliancepack", *args]
-    env = {"PYTHONPATH": str(Path(__file__).parent.parent / "src")}
-    return subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=cwd or Path(__file__).parent.parent,
-        env={**dict(__import__("os").environ), **env},
-    )
+from _cli import run_cli
 
 
 class TestDeterministicOutput:
     """Tests for deterministic output."""
 
-    def test_same_input_same_output(self):
+    def test_same_input_same_output(self, default_check_result):
         """Same input + fixed-time should produce identical output."""
         fixtures = Path(__file__).parent / "fixtures"
         input_file = fixtures / "sample_input.txt"
         policy_file = fixtures / "policy_v1.json"
 
-        result1 = run_cli(
-            "check",
-            "--input", str(input_file),
-            "--policy", str(policy_file),
-            "--fixed-time", "2025-01-01T00:00:00Z",
-        )
+        # The shared run is the first; the second runs here
+        result1 = default_check_result
         result2 = run_cli(
             "check",
             "--input", str(input_file),
@@ -73,63 +59,34 @@ class TestDeterministicOutput:
         # All outputs should be identical
         assert len(set(outputs)) == 1, "All outputs should be identical"
 
-    def test_output_is_valid_json(self):
+    def test_output_is_valid_json(self, default_check_result):
         """Output should be valid JSON."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-        policy_file = fixtures / "policy_v1.json"
-
-        result = run_cli(
-            "check",
-            "--input", str(input_file),
-            "--policy", str(policy_file),
-            "--fixed-time", "2025-01-01T00:00:00Z",
-        )
+        result = default_check_result
 
         # Exit code 0 or 3 are valid (3 = findings found)
         assert result.returncode in (0, 3)
         output = json.loads(result.stdout)
         assert output["format"] == "compliancepack.check.v1"
 
-    def test_json_keys_sorted(self):
+    def test_json_keys_sorted(self, default_check_result):
         """JSON keys should be sorted for determinism."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-        policy_file = fixtures / "policy_v1.json"
-
-        result = run_cli(
-            "check",
-            "--input", str(input_file),
-            "--policy", str(policy_file),
-            "--fixed-time", "2025-01-01T00:00:00Z",
-        )
+        result = default_check_result
 
         # Exit code 0 or 3 are valid (3 = findings found)
         assert result.returncode in (0, 3)
 
         # Parse and re-serialize with sort_keys=True
         output = json.loads(result.stdout)
-        reserialized = json.dumps(output, sort_keys=True, separators=(",", ": "))
+        reserialized = json.dumps(
+            output, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
 
         # Original output should already be sorted
         assert result.stdout.strip() == reserialized
 
-    def test_findings_order_deterministic(self):
+    def test_findings_order_deterministic(self, default_check_json):
         """Findings should always be in the same order."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-        policy_file = fixtures / "policy_v1.json"
-
-        result = run_cli(
-            "check",
-            "--input", str(input_file),
-            "--policy", str(policy_file),
-            "--fixed-time", "2025-01-01T00:00:00Z",
-        )
-
-        # Exit code 0 or 3 are valid (3 = findings found)
-        assert result.returncode in (0, 3)
-        output = json.loads(result.stdout)
+        output = default_check_json
 
         # Findings should be sorted by severity then id
         findings = output["findings"]
@@ -145,22 +102,9 @@ class TestDeterministicOutput:
             else:
                 assert current_rank < next_rank, "Higher severity should come first"
 
-    def test_samples_order_deterministic(self):
+    def test_samples_order_deterministic(self, default_check_json):
         """Samples within a finding should always be in the same order."""
-        fixtures = Path(__file__).parent / "fixtures"
-        input_file = fixtures / "sample_input.txt"
-        policy_file = fixtures / "policy_v1.json"
-
-        result = run_cli(
-            "check",
-            "--input", str(input_file),
-            "--policy", str(policy_file),
-            "--fixed-time", "2025-01-01T00:00:00Z",
-        )
-
-        # Exit code 0 or 3 are valid (3 = findings found)
-        assert result.returncode in (0, 3)
-        output = json.loads(result.stdout)
+        output = default_check_json
 
         for finding in output["findings"]:
             samples = finding["samples"]
@@ -172,3 +116,179 @@ class TestDeterministicOutput:
                     assert current["col_start"] <= next_s["col_start"]
                 else:
                     assert current["line"] < next_s["line"]
+
+
+class TestOutputEncoding:
+    """Tests for the JSON encoder paths used by the CLI."""
+
+    SAMPLE = {
+        "b": [1, {"z": "café", "a": None}],
+        "a": True,
+        "excerpt": "tab\there \"quoted\"",
+    }
+
+    def test_compact_separators(self, capsysbinary):
+        """Output uses compact separators and a trailing newline."""
+        from compliancepack.cli import _output_json
+
+        _output_json({"b": 1, "a": [1, 2]})
+        assert capsysbinary.readouterr().out == b'{"a":[1,2],"b":1}\n'
+
+    def test_stdlib_fallback_matches_orjson(self, capsysbinary, monkeypatch):
+        """orjson and the stdlib fallback must emit identical bytes."""
+        pytest.importorskip("orjson")
+        from compliancepack.cli import _output_json
+
+        _output_json(self.SAMPLE)
+        fast = capsysbinary.readouterr().out
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        _output_json(self.SAMPLE)
+        fallback = capsysbinary.readouterr().out
+
+        assert fast == fallback
+
+    def test_fallback_writes_document_once(self, monkeypatch):
+        """The stdlib path writes the whole document as one bytes write."""
+        import io
+
+        from compliancepack.cli import _output_json
+
+        class RecordingBuffer(io.BytesIO):
+            def __init__(self):
+                super().__init__()
+                self.writes = []
+
+            def write(self, data):
+                self.writes.append(bytes(data))
+                return super().write(data)
+
+        buffer = RecordingBuffer()
+        monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(buffer, encoding="utf-8"))
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        _output_json(self.SAMPLE)
+
+        assert len(buffer.writes) == 1
+        assert json.loads(buffer.writes[0]) == self.SAMPLE
+        assert buffer.writes[0].endswith(b"}\n")
+
+    def test_outputs_bypass_text_layer(self, monkeypatch):
+        """Both report writers send bytes to stdout.buffer, never text."""
+        import io
+
+        from compliancepack.cli import _output_check_report, _output_json
+
+        class TextRecorder(io.TextIOWrapper):
+            def write(self, text):
+                raise AssertionError(f"text write: {text!r}")
+
+        raw = io.BytesIO()
+        monkeypatch.setattr(sys, "stdout", TextRecorder(raw, encoding="utf-8"))
+
+        _output_json(self.SAMPLE)
+        _output_check_report({"format": "compliancepack.check.v1"}, [{"id": "é"}], 1)
+
+        first, second = raw.getvalue().splitlines()
+        assert json.loads(first) == self.SAMPLE
+        assert json.loads(second)["findings"] == [{"id": "é"}]
+
+    def test_streamed_report_matches_merged_encoding(self, capsysbinary):
+        """Streaming findings must produce the same bytes as one dumps call."""
+        from compliancepack.cli import _output_check_report, _output_json
+
+        envelope = {
+            "format": "compliancepack.check.v1",
+            "truncated": True,
+            "exit_code_expected": 3,
+        }
+        findings = [
+            {"id": "CP0002", "samples": []},
+            {"id": "CP0001", "samples": [{"line": 1}]},
+            {"id": "CP0003"},
+        ]
+
+        _output_json({**envelope, "findings": findings[:2]})
+        expected = capsysbinary.readouterr().out
+
+        _output_check_report(envelope, findings, 2)
+        assert capsysbinary.readouterr().out == expected
+
+        _output_check_report(envelope, findings, 0)
+        assert b'"findings":[]' in capsysbinary.readouterr().out
+
+    def test_encode_failure_writes_nothing(self, capsysbinary, monkeypatch):
+        """A finding that fails to encode leaves stdout empty, not truncated."""
+        from compliancepack import cli
+
+        encode = cli._json_encoder()
+
+        def failing_encoder():
+            def encode_or_fail(value):
+                if value == {"id": "CP0002"}:
+                    raise TypeError("unencodable finding")
+                return encode(value)
+            return encode_or_fail
+
+        monkeypatch.setattr(cli, "_json_encoder", failing_encoder)
+        findings = [{"id": "CP0001"}, {"id": "CP0002"}]
+
+        with pytest.raises(TypeError):
+            cli._output_check_report({"exit_code_expected": 3}, findings, 2)
+        assert capsysbinary.readouterr().out == b""
+
+    def test_full_report_identical_without_orjson(self, capsysbinary, monkeypatch):
+        """A real directory-scan report is byte-identical on both encoders."""
+        pytest.importorskip("orjson")
+        from compliancepack.cli import main
+
+        argv = [
+            "check",
+            "--input", str(Path(__file__).parent / "fixtures" / "scan_tree"),
+            "--pack", "secrets.v1",
+            "--fixed-time", "2025-01-01T00:00:00Z",
+            "--no-redact",
+        ]
+
+        with pytest.raises(SystemExit):
+            main(argv)
+        fast = capsysbinary.readouterr().out
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        with pytest.raises(SystemExit):
+            main(argv)
+        fallback = capsysbinary.readouterr().out
+
+        assert b'"findings":[{' in fast
+        assert fast == fallback
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_utf8_file_name_reported(self, tmp_path, capsysbinary, monkeypatch, use_orjson):
+        """A file name that is not valid UTF-8 is written back as its raw bytes."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        from compliancepack.cli import main
+
+        fixtures = Path(__file__).parent / "fixtures"
+        try:
+            bad = Path(os.fsdecode(os.path.join(os.fsencode(tmp_path), b"bad\xff.txt")))
+            bad.write_bytes((fixtures / "sample_input.txt").read_bytes())
+        except (OSError, UnicodeError):
+            pytest.skip("filesystem does not accept non-UTF-8 names")
+
+        with pytest.raises(SystemExit) as exc:
+            main([
+                "check",
+                "--input", str(tmp_path),
+                "--policy", str(fixtures / "policy_v1.json"),
+                "--fixed-time", "2025-01-01T00:00:00Z",
+            ])
+
+        out = capsysbinary.readouterr().out
+        assert exc.value.code == 3
+        assert b"bad\xff.txt" in out
+        report = json.loads(out.decode("utf-8", "surrogateescape"))
+        assert report["scan_stats"]["files_scanned"] == 1
+        assert report["findings"]
@@ -166,6 +166,145 @@ class TestMultipleInputs:
         assert output["scan_stats"]["files_scanned"] == 2
 
 
+class TestExtensionParsing:
+    """Tests for --include-ext parsing."""
+
+    def test_parse_extensions_returns_frozenset(self):
+        """Extensions are normalized into an immutable set."""
+        from compliancepack.cli import _parse_extensions
+
+        assert _parse_extensions("TXT, .env,,") == frozenset({".txt", ".env"})
+        assert isinstance(_parse_extensions(".txt"), frozenset)
+
+    def test_parse_extensions_none_when_empty(self):
+        """No usable extension means no filter at all."""
+        from compliancepack.cli import _parse_extensions
+
+        assert _parse_extensions(None) is None
+        assert _parse_extensions(" , ") is None
+
+
+class TestInputStat:
+    """Tests for single-stat input validation."""
+
+    def test_stat_once_regular_file_and_directory(self, tmp_path: Path):
+        """Regular files and directories are classified from one lstat."""
+        from compliancepack.cli import InputStat, _stat_once
+
+        file_path = tmp_path / "f.txt"
+        file_path.write_text("x")
+
+        assert _stat_once(str(file_path)) == InputStat(True, True)
+        assert _stat_once(str(tmp_path)) == InputStat(True, False)
+        assert _stat_once(str(tmp_path / "missing")).exists is False
+
+    def test_stat_once_follows_symlinks(self, tmp_path: Path):
+        """Symlinks report their target type; broken links do not exist."""
+        from compliancepack.cli import InputStat, _stat_once
+
+        target = tmp_path / "target.txt"
+        target.write_text("x")
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+        broken = tmp_path / "broken.txt"
+        broken.symlink_to(tmp_path / "nowhere.txt")
+
+        assert _stat_once(str(link)) == InputStat(True, True)
+        assert _stat_once(str(broken)).exists is False
+
+
+class TestConcurrentReads:
+    """Tests for concurrent file reading in directory scans."""
+
+    def test_streamed_contents_in_path_order_and_report_failures(self, tmp_path: Path):
+        """Contents stream in path order; unreadable files become read_error."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from compliancepack.cli import _StreamedContents
+
+        paths = []
+        for i in range(40):
+            path = tmp_path / f"f{i:02d}.txt"
+            path.write_text(f"line {i}")
+            paths.append(path)
+        missing = tmp_path / "e_missing.txt"
+        paths.insert(5, missing)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            contents = _StreamedContents(paths, 100, executor, window=8)
+            pairs = list(contents)
+
+        assert [key for key, _ in pairs] == sorted(str(p) for p in paths)
+        assert pairs[0] == (str(missing), "")
+        assert [content for _, content in pairs[1:]] == [f"line {i}" for i in range(40)]
+        assert contents.failures == [(missing, "read_error")]
+
+    def test_unsorted_files_all_scanned(self, tmp_path: Path):
+        """Files given out of path order are each read and scanned once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from compliancepack.cli import _StreamedContents
+        from compliancepack.engine import run_check_multi
+
+        files = [tmp_path / "b.txt", tmp_path / "a.txt"]
+        for path in files:
+            path.write_text("TODO\n")
+        policy_file = {
+            "schema_version": "1.0",
+            "policies": [{
+                "id": "CP0001", "title": "TODO", "severity": "low",
+                "type": "contains", "pattern": None, "needle": "TODO",
+                "description": "Find TODO", "sample_limit": 5,
+            }],
+        }
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = run_check_multi(
+                files=files,
+                file_contents=_StreamedContents(files, 100, executor, window=2),
+                input_roots=[str(tmp_path)],
+                policy_file=policy_file,
+                policy_path="policy.json",
+                generated_at_utc="2025-01-01T00:00:00Z",
+            )
+
+        assert result["scan_stats"]["files_with_findings"] == 2
+        assert result["findings"][0]["match_count"] == 2
+
+    def test_out_of_order_contents_rejected(self):
+        """Content pairs must follow the scan order, not silently skip files."""
+        from compliancepack.engine import run_check_multi
+
+        with pytest.raises(ValueError, match="out of scan order"):
+            run_check_multi(
+                files=[Path("a.txt"), Path("b.txt")],
+                file_contents=iter([("b.txt", "x"), ("a.txt", "y")]),
+                input_roots=["."],
+                policy_file={"schema_version": "1.0", "policies": []},
+                policy_path="policy.json",
+                generated_at_utc="2025-01-01T00:00:00Z",
+            )
+
+    def test_read_error_reported_in_scan_stats(self, tmp_path: Path):
+        """A file that fails to read is counted under files_skipped."""
+        (tmp_path / "a.txt").write_text("password=x\n")
+        (tmp_path / "b.txt").write_text("clean\n")
+        os.chmod(tmp_path / "b.txt", 0)
+        if os.access(tmp_path / "b.txt", os.R_OK):
+            pytest.skip("running with permission to read any file")
+
+        result = run_cli(
+            "check",
+            "--input", str(tmp_path),
+            "--pack", "secrets.v1",
+            "--fixed-time", "2025-01-01T00:00:00Z",
+        )
+
+        output = json.loads(result.stdout)
+        assert output["scan_stats"]["files_scanned"] == 2
+        assert output["scan_stats"]["files_skipped"] == {"read_error": 1}
+
+
 class TestSingleFileBackwardCompatibility:
     """Tests for single-file input backward compatibility."""
 
@@ -18,6 +18,7 @@ import pytest
 from compliancepack.packs import (
     PackError,
     _validate_pack_name,
+    clear_pack_cache,
     get_pack_path,
     list_packs,
     load_pack,
@@ -108,6 +109,107 @@ class TestLoadPack:
         assert "secrets.v1" in error_msg or "pii.v1" in error_msg
 
 
+class TestPackCache:
+    """Tests for per-process pack caching."""
+
+    def test_list_packs_returns_fresh_list(self):
+        """Mutating a returned listing does not affect later calls."""
+        packs = list_packs()
+        packs.clear()
+        assert "secrets.v1" in list_packs()
+
+    def test_load_pack_returns_independent_copies(self):
+        """Mutating a loaded pack does not leak into later loads."""
+        first = load_pack("secrets.v1")
+        expected = [dict(p) for p in first["policies"]]
+        first["policies"][0]["severity"] = "info"
+        first["policies"].pop()
+
+        assert load_pack("secrets.v1")["policies"] == expected
+
+    def test_pack_regexes_compiled_once(self, monkeypatch):
+        """Repeated loads share the patterns compiled when the pack was validated."""
+        import re
+
+        first = load_pack("pii.v1")
+        monkeypatch.setattr(re, "compile", lambda *a, **k: pytest.fail("recompiled"))
+        second = load_pack("pii.v1")
+
+        regex_pairs = [
+            (a, b) for a, b in zip(first["policies"], second["policies"])
+            if a["type"] == "regex"
+        ]
+        assert regex_pairs
+        for a, b in regex_pairs:
+            assert a["compiled"] is b["compiled"]
+            assert a["compiled"].pattern == a["pattern"]
+
+    def test_modified_pack_reloaded(self, tmp_path, monkeypatch):
+        """A pack whose file changes is read again; an unchanged one is not."""
+        import os
+
+        from compliancepack import packs
+
+        pack_path = tmp_path / "custom.v1.json"
+        policy = {
+            "id": "CP0001",
+            "title": "Todo",
+            "severity": "low",
+            "type": "contains",
+            "needle": "TODO",
+            "description": "Todo",
+        }
+        pack_path.write_text(json.dumps({"schema_version": "1.0", "policies": [policy]}))
+        os.utime(pack_path, ns=(1, 1))
+        monkeypatch.setattr(packs, "_get_packs_dir", lambda: tmp_path)
+        loads = []
+        load_policy_file = packs.load_policy_file
+
+        def counting_load(path):
+            loads.append(path)
+            return load_policy_file(path)
+
+        monkeypatch.setattr(packs, "load_policy_file", counting_load)
+
+        first = load_pack("custom.v1")
+        assert load_pack("custom.v1") == first
+        assert len(loads) == 1
+
+        policy["severity"] = "high"
+        pack_path.write_text(json.dumps({"schema_version": "1.0", "policies": [policy]}))
+        os.utime(pack_path, ns=(2, 2))
+
+        assert load_pack("custom.v1")["policies"][0]["severity"] == "high"
+        assert len(loads) == 2
+
+    def test_clear_pack_cache(self, monkeypatch):
+        """Packs are loaded and listed again only after the cache is cleared."""
+        from compliancepack import packs
+
+        loads = []
+        load_policy_file = packs.load_policy_file
+
+        def counting_load(path):
+            loads.append(path)
+            return load_policy_file(path)
+
+        monkeypatch.setattr(packs, "load_policy_file", counting_load)
+        clear_pack_cache()
+
+        before = load_pack("pii.v1")
+        names = list_packs()
+        assert load_pack("pii.v1") == before
+        assert list_packs() == names
+        assert len(loads) == 1
+        assert packs._list_pack_names.cache_info()[:2] == (1, 1)  # (hits, misses)
+
+        clear_pack_cache()
+        assert load_pack("pii.v1") == before
+        assert list_packs() == names
+        assert len(loads) == 2
+        assert packs._list_pack_names.cache_info()[:2] == (0, 1)
+
+
 class TestGetPackPath:
     """Tests for get_pack_path() function."""
 
@@ -207,6 +309,16 @@ class TestCLIListPacks:
         result = run_cli("check", "--list-packs")
         assert result.returncode == 0
 
+    def test_list_packs_ignores_other_options(self, capsys):
+        """--list-packs short-circuits before the other options are parsed."""
+        from compliancepack.cli import main
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["check", "--fail-on", "bogus", "--list-packs"])
+
+        assert exc_info.value.code == 0
+        assert "secrets.v1" in capsys.readouterr().out
+
 
 class TestCLIPolicyPackMutualExclusion:
     """Tests for CLI --policy XOR --pack enforcement."""
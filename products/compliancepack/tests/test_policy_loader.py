@@ -5,12 +5,12 @@ Tests for policy schema validation and deterministic ordering.
 """
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from compliancepack.policy import (
+    SEVERITY_LEVELS,
     PolicyValidationError,
     get_severity_rank,
     load_policy_file,
@@ -124,6 +124,83 @@ class TestLoadPolicyFile:
         with pytest.raises(json.JSONDecodeError):
             load_policy_file(policy_file)
 
+    @pytest.mark.parametrize("text", [
+        '{"a": [1, -2.5, true, null, "\\u00e9"], "a": {}}',
+        '{"n": 12345678901234567890123}',
+        '{"n": NaN, "s": "\\ud800"}',
+        "not valid json",
+        '{"a": 1,}',
+    ])
+    def test_decode_matches_stdlib(self, text):
+        """Decoded values and decode errors match json.loads."""
+        from compliancepack.policy import _decode_json
+
+        try:
+            expected = json.loads(text)
+        except json.JSONDecodeError as e:
+            with pytest.raises(json.JSONDecodeError) as info:
+                _decode_json(text)
+            assert str(info.value) == str(e)
+        else:
+            # repr, since NaN != NaN
+            assert repr(_decode_json(text)) == repr(expected)
+
+    def test_ids_and_severities_interned(self, tmp_path: Path):
+        """Policy ids and severities are interned at load time."""
+        import sys
+
+        policy = {
+            "schema_version": "1.0",
+            "policies": [
+                {
+                    "id": "CP" + "0042",
+                    "title": "Test Policy",
+                    "severity": "hi" + "gh",
+                    "type": "contains",
+                    "needle": "x",
+                    "description": "Test description",
+                }
+            ],
+        }
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_text(json.dumps(policy))
+
+        loaded = load_policy_file(policy_file)["policies"][0]
+
+        assert loaded["id"] is sys.intern("CP0042")
+        assert loaded["severity"] is sys.intern("high")
+
+    def test_regex_compiled_at_load(self, tmp_path: Path):
+        """Regex policies carry their compiled pattern; contains policies don't."""
+        policy = {
+            "schema_version": "1.0",
+            "policies": [
+                {
+                    "id": "CP0001",
+                    "title": "Regex",
+                    "severity": "high",
+                    "type": "regex",
+                    "pattern": "pass(word)?=\\S+",
+                    "description": "Test description",
+                },
+                {
+                    "id": "CP0002",
+                    "title": "Contains",
+                    "severity": "low",
+                    "type": "contains",
+                    "needle": "x",
+                    "description": "Test description",
+                },
+            ],
+        }
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_text(json.dumps(policy))
+
+        regex_policy, contains_policy = load_policy_file(policy_file)["policies"]
+
+        assert regex_policy["compiled"].pattern == regex_policy["pattern"]
+        assert "compiled" not in contains_policy
+
 
 class TestPolicyValidation:
     """Tests for individual policy validation."""
@@ -302,6 +379,26 @@ class TestPolicyValidation:
 
         assert result["policies"][0]["sample_limit"] == 3
 
+    def test_exact_count_defaults_true_and_must_be_bool(self, tmp_path: Path):
+        """exact_count is optional, defaults to true, and rejects non-booleans."""
+        entry = {
+            "id": "CP0001",
+            "title": "Test",
+            "severity": "high",
+            "type": "contains",
+            "needle": "test",
+            "description": "Test",
+        }
+        policy_file = tmp_path / "policy.json"
+
+        policy_file.write_text(json.dumps({"schema_version": "1.0", "policies": [entry]}))
+        assert load_policy_file(policy_file)["policies"][0]["exact_count"] is True
+
+        entry["exact_count"] = 0
+        policy_file.write_text(json.dumps({"schema_version": "1.0", "policies": [entry]}))
+        with pytest.raises(PolicyValidationError, match="exact_count"):
+            load_policy_file(policy_file)
+
 
 class TestSeverityRank:
     """Tests for severity ranking."""
@@ -316,3 +413,7 @@ class TestSeverityRank:
     def test_unknown_severity(self):
         """Unknown severity should return high value."""
         assert get_severity_rank("unknown") == 999
+
+    def test_ranks_follow_severity_levels(self):
+        """Each level ranks at its position in SEVERITY_LEVELS."""
+        assert [get_severity_rank(s) for s in SEVERITY_LEVELS] == [0, 1, 2, 3, 4]
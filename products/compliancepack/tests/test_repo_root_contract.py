@@ -347,3 +347,18 @@ class TestRepoRootDirectoryScan:
         assert "--max-bytes-per-file" in result.stdout
         assert "--include-ext" in result.stdout
         assert "--follow-symlinks" in result.stdout
+
+
+class TestPackageLayout:
+    """Test that the package ships a single CLI module."""
+
+    def test_single_cli_module(self):
+        """Exactly one cli*.py module exists in the installed package."""
+        from importlib.resources import files
+
+        cli_modules = [
+            entry.name
+            for entry in files("compliancepack").iterdir()
+            if entry.name.startswith("cli") and entry.name.endswith(".py")
+        ]
+        assert cli_modules == ["cli.py"]
@@ -189,6 +189,18 @@ class TestSarifLiteResults:
         assert "match_count" in props
         assert "excerpt_redacted" in props
 
+    def test_excerpt_redacted_flag(self):
+        """excerpt_redacted is set when any sample excerpt holds a redaction token."""
+        plain = {"line": 1, "col_start": 0, "col_end": 4, "excerpt": "TODO"}
+        redacted = {"line": 2, "col_start": 0, "col_end": 4, "excerpt": "id [REDACTED_KEY]"}
+
+        flags = []
+        for samples in ([plain], [plain, redacted], [{**plain, "excerpt": ""}]):
+            output = render_sariflite(make_check_result(findings=[make_finding(samples=samples)]))
+            flags.append(output["runs"][0]["results"][0]["properties"]["excerpt_redacted"])
+
+        assert flags == [False, True, False]
+
     def test_locations_from_samples(self):
         """Locations should be derived from samples."""
         samples = [
@@ -223,6 +235,25 @@ class TestSarifLiteDeterminism:
         assert results[1]["ruleId"] == "B001"
         assert results[2]["ruleId"] == "Z001"
 
+    def test_results_with_same_rule_sorted_by_first_location(self):
+        """Ties on level and ruleId fall back to the first location; none sorts first."""
+        def sample(file, line):
+            return {"file": file, "line": line, "col_start": 0, "col_end": 1, "excerpt": "x"}
+
+        findings = [
+            make_finding(id="A001", samples=[sample("b.txt", 1)]),
+            make_finding(id="A001", samples=[sample("a.txt", 9), sample("c.txt", 1)]),
+            make_finding(id="A001", samples=[]),
+            make_finding(id="A001", severity="critical", samples=[sample("a.txt", 2)]),
+        ]
+        output = render_sariflite(make_check_result(findings=findings))
+
+        firsts = [
+            (r["locations"][0]["file"], r["locations"][0]["line"]) if r["locations"] else None
+            for r in output["runs"][0]["results"]
+        ]
+        assert firsts == [None, ("a.txt", 2), ("a.txt", 9), ("b.txt", 1)]
+
     def test_locations_sorted_by_line_then_col(self):
         """Locations within a result should be sorted."""
         samples = [
@@ -5,7 +5,6 @@ Tests for directory traversal, file reading, and security boundaries.
 """
 
 import os
-import tempfile
 from pathlib import Path
 from typing import Set
 
@@ -89,6 +88,37 @@ class TestCollectTargets:
         # Both should match
         assert len(files) == 2
 
+    def test_extension_filter_applies_to_files_only(self, tmp_path: Path):
+        """Directories are entered whatever their name; only files are filtered."""
+        sub = tmp_path / "logs.d"
+        sub.mkdir()
+        (sub / "x.TXT").write_text("x")
+        (sub / "y.txt.bak").write_text("y")
+        (tmp_path / "z.txt").write_text("z")
+
+        files, skipped = collect_targets(
+            [tmp_path, tmp_path / "z.txt"],
+            include_extensions={".txt"},
+        )
+
+        root = tmp_path.resolve()
+        assert files == [root / "logs.d" / "x.TXT", root / "z.txt"]
+        assert skipped == [(root / "logs.d" / "y.txt.bak", "extension_filtered")]
+
+    def test_output_in_path_order_not_walk_order(self, tmp_path: Path):
+        """Walk order (a/ before a-b.txt) is re-sorted into path string order."""
+        sub = tmp_path / "a"
+        sub.mkdir()
+        (sub / "b.txt").write_text("b")
+        (tmp_path / "a-b.txt").write_text("ab")
+        (tmp_path / "a.txt").write_text("a")
+
+        files, _ = collect_targets([tmp_path])
+
+        root = tmp_path.resolve()
+        assert files == [root / "a-b.txt", root / "a.txt", root / "a" / "b.txt"]
+        assert [str(f) for f in files] == sorted(str(f) for f in files)
+
     def test_max_files_limit(self, tmp_path: Path):
         """Max files limit caps collection."""
         for i in range(10):
@@ -123,6 +153,18 @@ class TestCollectTargets:
         assert files[0].name == "real.txt"
         assert any("symlink_skipped" in reason for _, reason in skipped)
 
+    def test_symlinked_root_with_trailing_slash_skipped(self, tmp_path: Path):
+        """A trailing slash does not make a symlinked root read as its target."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "a.txt").write_text("a")
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+
+        files, skipped = collect_targets([f"{tmp_path / 'link'}{os.sep}"])
+
+        assert files == []
+        assert skipped == [(tmp_path / "link", "symlink_skipped")]
+
     def test_symlink_followed_when_enabled(self, tmp_path: Path):
         """Symlinks are followed when enabled."""
         real_file = tmp_path / "real.txt"
@@ -136,10 +178,36 @@ class TestCollectTargets:
         # so we should get the file once (deduplicated by resolve())
         assert len(files) == 1
 
+    def test_symlink_cycle_terminates(self, tmp_path: Path):
+        """A symlink back to an ancestor directory is entered only once."""
+        (tmp_path / "a.txt").write_text("a")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.txt").write_text("b")
+        (sub / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        files, skipped = collect_targets([tmp_path], follow_symlinks=True)
+
+        assert files == [(tmp_path / "a.txt").resolve(), (sub / "b.txt").resolve()]
+        assert (sub / "loop", "symlink_loop") in skipped
+
+    def test_symlink_to_walked_sibling_not_a_loop(self, tmp_path: Path):
+        """A second route to a directory already walked is deduplicated silently."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "a.txt").write_text("a")
+        (tmp_path / "zlink").symlink_to(shared, target_is_directory=True)
+
+        files, skipped = collect_targets([tmp_path], follow_symlinks=True)
+
+        assert files == [(shared / "a.txt").resolve()]
+        assert skipped == []
+
     def test_symlink_escape_blocked(self, tmp_path: Path):
         """Symlinks escaping boundary are blocked even when following."""
-        # Create a file outside the scan boundary
-        outside = tmp_path.parent / "outside.txt"
+        # Create a file outside the scan boundary (a sibling of the scanned
+        # directory, so it stays in this test's tmp_path)
+        outside = tmp_path / "outside.txt"
         outside.write_text("outside")
 
         scan_dir = tmp_path / "scan"
@@ -150,15 +218,9 @@ class TestCollectTargets:
         files, skipped = collect_targets([scan_dir], follow_symlinks=True)
 
         assert len(files) == 0
-        # The escape is detected either as path_traversal or symlink_escape
-        # depending on when the boundary check happens
-        assert any(
-            "symlink_escape" in reason or "path_traversal" in reason
-            for _, reason in skipped
-        )
-
-        # Cleanup
-        outside.unlink()
+        # The link's resolved target is checked against the boundary like any
+        # input (there is no separate symlink_escape reason)
+        assert skipped == [(scan_dir.resolve() / "escape.txt", "path_traversal")]
 
     def test_nonexistent_input_skipped(self, tmp_path: Path):
         """Nonexistent inputs are skipped."""
@@ -169,6 +231,16 @@ class TestCollectTargets:
         assert len(files) == 0
         assert any("not_found" in reason for _, reason in skipped)
 
+    def test_string_inputs_match_path_inputs(self, tmp_path: Path):
+        """Inputs may be plain strings; results match Path inputs."""
+        (tmp_path / "a.txt").write_text("a")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.txt").write_text("b")
+
+        assert collect_targets([str(tmp_path)]) == collect_targets([tmp_path])
+        assert collect_targets([str(sub / "b.txt")])[0] == [(sub / "b.txt").resolve()]
+
     def test_multiple_inputs(self, tmp_path: Path):
         """Multiple inputs are combined."""
         dir1 = tmp_path / "dir1"
@@ -183,6 +255,22 @@ class TestCollectTargets:
 
         assert len(files) == 2
 
+    def test_overlapping_roots_share_one_walk(self, tmp_path: Path):
+        """Roots are walked in order with shared state: no re-entry, one file budget."""
+        sub = tmp_path / "a"
+        sub.mkdir()
+        (sub / "x.txt").write_text("x")
+        (tmp_path / "y.txt").write_text("y")
+        root = tmp_path.resolve()
+
+        files, skipped = collect_targets([sub, tmp_path])
+        assert files == [root / "a" / "x.txt", root / "y.txt"]
+        assert skipped == []
+
+        files, skipped = collect_targets([sub, tmp_path], max_files=1)
+        assert files == [root / "a" / "x.txt"]
+        assert skipped == [(Path("<truncated>"), "max_files_exceeded:1")]
+
     def test_path_traversal_blocked(self, tmp_path: Path):
         """Path traversal attempts are blocked."""
         scan_dir = tmp_path / "scan"
@@ -202,6 +290,168 @@ class TestCollectTargets:
         assert len(files) == 1
         assert files[0].name == "safe.txt"
 
+    def test_directory_entries_not_stat_or_resolved(self, tmp_path: Path, monkeypatch):
+        """Plain directory entries are typed by the listing, not stat or resolve."""
+        import sys
+
+        from compliancepack import scanner
+
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "a.txt").write_text("a")
+        real_stat = os.stat
+        stats = []
+
+        def counting_stat(path, *args, **kwargs):
+            # Only the scanner's own calls (pathlib also calls os.stat)
+            if sys._getframe(1).f_code.co_filename == scanner.__file__:
+                stats.append(str(path))
+            return real_stat(path, *args, **kwargs)
+
+        resolved = []
+        normalize_path = scanner._normalize_path
+
+        def counting_normalize(path):
+            resolved.append(path)
+            return normalize_path(path)
+
+        monkeypatch.setattr(scanner.os, "stat", counting_stat)
+        monkeypatch.setattr(scanner, "_normalize_path", counting_normalize)
+        files, _ = collect_targets([tmp_path])
+
+        assert [f.name for f in files] == ["a.txt"]
+        assert str(sub.resolve()) not in stats
+        assert resolved == []  # The root's realpath is reused
+
+    def test_paths_resolved_once(self, tmp_path: Path, monkeypatch):
+        """Each root and each followed symlink is resolved exactly once."""
+        (tmp_path / "real.txt").write_text("real")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "real.txt")
+        expected = [(tmp_path / "real.txt").resolve()]
+        real_realpath = os.path.realpath
+        calls = []
+
+        def counting_realpath(path, *args, **kwargs):
+            calls.append(os.fspath(path))
+            return real_realpath(path, *args, **kwargs)
+
+        monkeypatch.setattr(os.path, "realpath", counting_realpath)
+        files, skipped = collect_targets([tmp_path, tmp_path / "real.txt"], follow_symlinks=True)
+
+        assert files == expected
+        assert sorted(calls) == sorted([
+            str(tmp_path), str(tmp_path / "real.txt"), str(tmp_path.resolve() / "link.txt"),
+        ])
+
+    def test_symlink_entries_not_lstat_again(self, tmp_path: Path, monkeypatch):
+        """Symlinks typed by the listing are not re-checked with lstat."""
+        (tmp_path / "real.txt").write_text("real")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "real.txt")
+        checked = []
+        islink = os.path.islink
+
+        def recording_islink(path):
+            checked.append(os.path.basename(path))
+            return islink(path)
+
+        monkeypatch.setattr(os.path, "islink", recording_islink)
+        files, skipped = collect_targets([tmp_path])
+
+        assert [f.name for f in files] == ["real.txt"]
+        assert [(p.name, reason) for p, reason in skipped] == [("link.txt", "symlink_skipped")]
+        assert checked == [tmp_path.name]  # The root only
+
+    def test_deep_tree_walked_without_recursion(self, tmp_path: Path):
+        """Directory depth is not bounded by the interpreter recursion limit."""
+        import sys
+
+        depth = 200
+        deepest = tmp_path
+        for _ in range(depth):
+            deepest = deepest / "d"
+            deepest.mkdir()
+        (deepest / "leaf.txt").write_text("x")
+        (tmp_path / "z.txt").write_text("z")
+
+        # Leave far fewer free frames than the tree is deep
+        frames, frame = 0, sys._getframe()
+        while frame is not None:
+            frames, frame = frames + 1, frame.f_back
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(frames + 50)
+        try:
+            files, skipped = collect_targets([tmp_path])
+        finally:
+            sys.setrecursionlimit(limit)
+
+        root = tmp_path.resolve()
+        assert files == [root.joinpath(*["d"] * depth, "leaf.txt"), root / "z.txt"]
+        assert skipped == []
+
+    def test_suffix_matches_pathlib(self):
+        """The entry-name suffix test agrees with Path.suffix."""
+        from compliancepack.scanner import _suffix
+
+        for name in ["a.TXT", ".env", "a.", "a", "x.tar.gz", "..", ".a.b", "a..b"]:
+            assert _suffix(name) == Path(name).suffix.lower()
+
+    def test_special_entries_and_filters_reported(self, tmp_path: Path):
+        """Entries keep their skip reasons when typed from the listing."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.bin").write_text("b")
+        os.mkfifo(tmp_path / "pipe")
+
+        files, skipped = collect_targets([tmp_path], include_extensions={".txt"})
+
+        root = tmp_path.resolve()
+        assert files == [root / "a.txt"]
+        assert skipped == [
+            (root / "b.bin", "extension_filtered"),
+            (root / "pipe", "special_file"),
+        ]
+
+    def test_boundary_checked_per_root_not_per_entry(self, tmp_path: Path, monkeypatch):
+        """Plain entries inherit their directory's boundary membership."""
+        from compliancepack import scanner
+
+        for name in ("a", "b"):
+            sub = tmp_path / name
+            sub.mkdir()
+            for i in range(10):
+                (sub / f"{i}.txt").write_text("x")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "a" / "0.txt")
+        checked = []
+        is_within_boundaries = scanner._is_within_boundaries
+
+        def recording_is_within_boundaries(target, boundaries, prefixes):
+            checked.append(target)
+            return is_within_boundaries(target, boundaries, prefixes)
+
+        monkeypatch.setattr(scanner, "_is_within_boundaries", recording_is_within_boundaries)
+        files, _ = collect_targets([tmp_path], follow_symlinks=True)
+
+        root = tmp_path.resolve()
+        assert len(files) == 20
+        assert checked == [str(root), str(root / "a" / "0.txt")]  # Root, symlink
+
+    def test_boundary_check_is_component_wise(self):
+        """A boundary contains itself and paths below it, not name-prefixed siblings."""
+        from compliancepack.scanner import _boundary_prefix, _is_within_boundaries
+
+        def within(target, *boundaries):
+            prefixes = tuple(_boundary_prefix(b) for b in boundaries)
+            return _is_within_boundaries(target, frozenset(boundaries), prefixes)
+
+        sep = os.sep
+        root = f"{sep}srv{sep}data"
+        assert within(root, root)
+        assert within(f"{root}{sep}a{sep}b.txt", root)
+        assert not within(f"{root}2{sep}b.txt", root)
+        assert not within(f"{sep}srv", root)
+        assert within(f"{sep}etc", sep)
+        assert within(f"{root}2{sep}b.txt", root, f"{root}2")
+        assert not within(f"{sep}srv", root, f"{root}2")
+
     def test_max_files_validation(self, tmp_path: Path):
         """max_files must be >= 1."""
         with pytest.raises(ValueError, match="max_files must be >= 1"):
@@ -255,6 +505,98 @@ class TestReadFileLimited:
         # Should not raise, content decoded as latin-1
         assert "Hello" in result
 
+    def test_large_file_matches_plain_read(self, tmp_path: Path):
+        """Large files decode exactly like small ones."""
+        test_file = tmp_path / "big.txt"
+        content = "key=值\n" * 20_000
+        test_file.write_text(content, encoding="utf-8")
+
+        result, truncated = read_file_limited(test_file, max_bytes=10_000_000)
+        assert result == content
+        assert not truncated
+
+        # A cut through a multi-byte character falls back to latin-1
+        raw = content.encode("utf-8")[:100_005]
+        result, truncated = read_file_limited(test_file, max_bytes=100_005)
+        assert truncated
+        assert result == raw.decode("latin-1")
+
+    def test_large_file_latin1_fallback(self, tmp_path: Path):
+        """Large non-UTF8 content falls back to latin-1."""
+        test_file = tmp_path / "big_latin1.txt"
+        test_file.write_bytes(b"\xff" + b"a" * 100_000)
+
+        result, truncated = read_file_limited(test_file)
+
+        assert result == "\xff" + "a" * 100_000
+        assert not truncated
+
+    def test_file_shrunk_after_stat(self, tmp_path: Path):
+        """A file truncated after its size was taken reads short, not fatally."""
+        test_file = tmp_path / "rotated.log"
+        test_file.write_bytes(b"x" * 200_000)
+        size = os.stat(test_file).st_size
+        test_file.write_bytes(b"y" * 10)
+
+        assert read_file_limited(test_file, file_size=size) == ("y" * 10, False)
+
+    def test_caller_supplied_size(self, tmp_path: Path):
+        """A size from the caller's stat decides truncation without re-stat."""
+        test_file = tmp_path / "sized.txt"
+        test_file.write_text("x" * 50)
+        size = os.stat(test_file).st_size
+
+        assert read_file_limited(test_file, max_bytes=10, file_size=size) == ("x" * 10, True)
+        assert read_file_limited(test_file, max_bytes=50, file_size=size) == ("x" * 50, False)
+
+    def test_size_from_open_descriptor(self, tmp_path: Path, monkeypatch):
+        """Without a caller size, the opened file is fstat'ed; the path is not stat'ed."""
+        test_file = tmp_path / "plain.txt"
+        test_file.write_text("x" * 50)
+        fstat = os.fstat
+        fstats = []
+
+        def counting_fstat(fd):
+            fstats.append(fd)
+            return fstat(fd)
+
+        monkeypatch.setattr(os, "stat", lambda *a, **k: pytest.fail("path stat"))
+        monkeypatch.setattr(os, "fstat", counting_fstat)
+
+        assert read_file_limited(test_file, max_bytes=10) == ("x" * 10, True)
+        assert len(fstats) == 1
+
+    def test_stale_size_reads_stat_length(self, tmp_path: Path):
+        """A file grown since the stat is read to the stat's length."""
+        test_file = tmp_path / "grown.txt"
+        test_file.write_text("x" * 50)
+
+        assert read_file_limited(test_file, max_bytes=100, file_size=20) == ("x" * 20, False)
+        assert read_file_limited(test_file, max_bytes=100, file_size=0) == ("x" * 50, False)
+
+    def test_short_reads_continued(self, tmp_path: Path, monkeypatch):
+        """Reads returning fewer bytes than asked are continued to size or EOF."""
+        import io
+
+        from compliancepack import scanner
+
+        test_file = tmp_path / "short.txt"
+        test_file.write_text("x" * 50)
+
+        class ShortReads(io.FileIO):
+            def read(self, size=-1):
+                return super().read(min(size, 7))
+
+        monkeypatch.setattr(
+            scanner, "open", lambda path, mode, buffering: ShortReads(path, mode), raising=False
+        )
+
+        assert read_file_limited(test_file, max_bytes=100) == ("x" * 50, False)
+        assert read_file_limited(test_file, max_bytes=30) == ("x" * 30, True)
+        # An unreliable zero size is read past the limit to detect truncation
+        assert read_file_limited(test_file, max_bytes=30, file_size=0) == ("x" * 30, True)
+        assert read_file_limited(test_file, max_bytes=50, file_size=0) == ("x" * 50, False)
+
     def test_file_not_found(self, tmp_path: Path):
         """Missing file raises ScanError."""
         missing = tmp_path / "missing.txt"
@@ -319,6 +661,21 @@ class TestSummarizeSkipped:
         assert result["resolve_error"] == 2
         assert result["read_error"] == 1
 
+    def test_only_known_dynamic_reasons_trimmed(self):
+        """Detail suffixes are dropped for known reasons; other reasons are kept whole."""
+        skipped = [
+            (Path("a"), "read_error"),
+            (Path("b"), "read_error:[Errno 5] I/O error: 'b'"),
+            (Path("<truncated>"), "max_files_exceeded:7"),
+            (Path("c"), "custom:reason"),
+        ]
+
+        assert summarize_skipped(skipped) == {
+            "custom:reason": 1,
+            "max_files_exceeded": 1,
+            "read_error": 2,
+        }
+
 
 class TestDirectoryScanIntegration:
     """Integration tests for directory scanning."""
@@ -14,6 +14,7 @@ from compliancepack.threshold import (
     EXIT_RUNTIME,
     EXIT_USAGE,
     EXIT_VIOLATION,
+    count_and_truncate,
     count_violations,
     determine_exit_code,
     get_threshold_rank,
@@ -170,6 +171,62 @@ class TestCountViolations:
         count, ids = count_violations(findings, "info")
         assert count == 2
 
+    def test_threshold_validated_once(self, monkeypatch):
+        """The threshold is ranked once per call; unknown severities never violate."""
+        from compliancepack import threshold
+
+        calls = []
+        get_threshold_rank = threshold.get_threshold_rank
+
+        def counting_threshold_rank(severity):
+            calls.append(severity)
+            return get_threshold_rank(severity)
+
+        monkeypatch.setattr(threshold, "get_threshold_rank", counting_threshold_rank)
+        findings = [{"id": f"T{i}", "severity": s} for i, s in enumerate(["high", "bogus", "low"] * 10)]
+
+        count, ids = count_violations(findings, "low")
+
+        assert calls == ["low"]
+        assert count == 20
+        assert "T1" not in ids
+        with pytest.raises(ValueError):
+            count_violations(findings, "severe")
+
+
+class TestCountAndTruncate:
+    """Test the fused violation count + max_findings cut."""
+
+    SORTED = [
+        {"id": "A", "severity": "critical"},
+        {"id": "B", "severity": "high"},
+        {"id": "C", "severity": "high"},
+        {"id": "D", "severity": "medium"},
+        {"id": "E", "severity": "info"},
+    ]
+
+    @pytest.mark.parametrize("threshold", ["critical", "high", "medium", "low", "info"])
+    def test_matches_count_violations(self, threshold):
+        """Binary-search count equals the linear count on sorted findings."""
+        count, limit, truncated = count_and_truncate(self.SORTED, threshold)
+        assert count == count_violations(self.SORTED, threshold)[0]
+        assert (limit, truncated) == (len(self.SORTED), False)
+
+    def test_empty_findings(self):
+        """Empty findings: nothing to count or cut."""
+        assert count_and_truncate([], "high", 3) == (0, 0, False)
+
+    def test_truncation_bound(self):
+        """max_findings below the total truncates; violations use all findings."""
+        assert count_and_truncate(self.SORTED, "medium", 2) == (4, 2, True)
+        assert count_and_truncate(self.SORTED, "medium", 5) == (4, 5, False)
+        assert count_and_truncate(self.SORTED, "medium", 0) == (4, 5, False)
+
+    def test_invalid_threshold_raises(self):
+        """Invalid threshold severity raises ValueError."""
+        with pytest.raises(ValueError):
+            count_and_truncate(self.SORTED, "urgent")
+
 
 class TestDetermineExitCode:
     """Test exit code determination."""